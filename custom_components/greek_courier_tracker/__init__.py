@@ -4,54 +4,138 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import timedelta
+import time
+from collections.abc import Mapping, Sequence
+from dataclasses import asdict, replace
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import Any
 
-import async_timeout
+import aiohttp
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.const import Platform
 
 from .const import (
     CONF_SCAN_INTERVAL,
     CONF_TRACKING_NUMBERS,
+    CONFIG_ENTRY_VERSION,
+    COURIER_AUTO,
+    DATA_COURIER_CACHE,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
+    MAX_CONCURRENT_TRACKING,
+    POLL_INTERVAL_MULTIPLIERS,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+    TRACKING_TIMEOUT,
 )
-from .couriers import track_with_auto_detect
-from .couriers.base import TrackingResult
+from .couriers import (
+    COURIER_REGISTRY,
+    _track_with_retry,
+    get_courier,
+    has_tracking_data,
+    track_with_auto_detect,
+    track_with_known_courier,
+    warm_up_connections,
+)
+from .couriers.base import BaseCourier, TrackingEvent, TrackingResult
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 _LOGGER = logging.getLogger(__name__)
 
+# Refresh interval once every tracking number is delivered and stopped
+IDLE_UPDATE_INTERVAL = timedelta(hours=24)
+
+# Result statuses that don't replace previously fetched data
+_BAD_STATUSES = frozenset(("Error", "Not Found"))
+
+_UTC = timezone.utc
+
+
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the integration from configuration.yaml (not used)."""
     _LOGGER.info("Setting up Greek Courier Tracker integration")
     return True
 
 
+def _migrate_tracking_data(data: list) -> list[dict[str, Any]]:
+    """Migrate old tracking number format to include courier field."""
+    if not data:
+        return []
+
+    # Version 1 -> 2: list of strings to list of dicts
+    if isinstance(data[0], str):
+        _LOGGER.info("Migrating tracking numbers from old format to new format")
+        return [
+            {
+                "tracking_number": number,
+                "name": number,
+                "stop_tracking_delivered": False,
+                "courier": COURIER_AUTO,
+            }
+            for number in data
+        ]
+
+    # Already version 3 - items are written with the same shape, so checking
+    # the first one is enough
+    if isinstance(data[0], dict) and "courier" in data[0]:
+        return data
+
+    # Version 2 -> 3: add courier field if missing
+    for item in data:
+        if isinstance(item, dict) and "courier" not in item:
+            item["courier"] = COURIER_AUTO
+
+    return data
+
+
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate an entry saved by an older version to the current format."""
+    version = CONFIG_ENTRY_VERSION
+    if entry.version > version:
+        # Saved by a newer version of the integration
+        return False
+
+    _LOGGER.info("Migrating config entry from version %s to %s", entry.version, version)
+    data = dict(entry.data)
+    options = dict(entry.options)
+    for stored in (data, options):
+        if CONF_TRACKING_NUMBERS in stored:
+            # Copy the items, the migration fills in missing fields in place
+            stored[CONF_TRACKING_NUMBERS] = _migrate_tracking_data([
+                dict(item) if isinstance(item, dict) else item
+                for item in stored[CONF_TRACKING_NUMBERS]
+            ])
+        if entry.version < 4 and CONF_SCAN_INTERVAL in stored:
+            # Versions before 4 stored the scan interval in hours
+            stored[CONF_SCAN_INTERVAL] *= 60
+
+    hass.config_entries.async_update_entry(entry, data=data, options=options, version=version)
+    _LOGGER.info("Migration to version %s complete", version)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Greek Courier Tracker from a config entry."""
     _LOGGER.info("Setting up Greek Courier Tracker from config entry: %s", entry.entry_id)
-    _LOGGER.debug("Entry data: %s", entry.data)
-    _LOGGER.debug("Entry options: %s", entry.options)
 
     try:
         tracking_data = _get_tracking_data(entry)
         scan_interval = _get_scan_interval(entry)
 
-        # Extract just the tracking numbers for the coordinator
-        tracking_numbers = [
-            item.get("tracking_number", item) if isinstance(item, dict) else item
-            for item in tracking_data
-        ]
-
-        # Build a map of tracking_number -> config (name, stop_tracking_delivered, etc.)
-        tracking_configs = {
-            item.get("tracking_number", item) if isinstance(item, dict) else item: item
-            for item in tracking_data
-        }
+        # Extract the tracking numbers and build a map of
+        # tracking_number -> config (name, stop_tracking_delivered, etc.) in one pass
+        tracking_numbers = []
+        tracking_configs = {}
+        for item in tracking_data:
+            key = item["tracking_number"]
+            tracking_numbers.append(key)
+            tracking_configs[key] = item
 
         _LOGGER.info("Tracking numbers: %s", tracking_numbers)
         _LOGGER.info("Tracking configs: %s", tracking_configs)
@@ -66,8 +150,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             tracking_numbers=tracking_numbers,
             tracking_configs=tracking_configs,
             scan_interval=scan_interval,
+            courier_cache=hass.data.setdefault(DATA_COURIER_CACHE, {}),
+            store=_get_store(hass, entry),
         )
 
+        # Start from the results saved before the last restart, so the first
+        # refresh only fetches the numbers that are due again
+        await coordinator.async_restore()
+
+        # Connect to the courier hosts the first refresh will use in one go
+        await coordinator.async_warm_up()
+
         # Initial refresh to validate configuration
         _LOGGER.info("Performing initial data refresh...")
         await coordinator.async_config_entry_first_refresh()
@@ -95,42 +188,65 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the saved results when a config entry is deleted."""
+    await _get_store(hass, entry).async_remove()
+
+
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Handle options update."""
+    """Handle options update.
+
+    Reloading recreates the coordinator, which also restores the configured
+    scan interval if it was slowed down because every parcel was delivered.
+    """
     _LOGGER.info("Config entry updated, reloading: %s", entry.entry_id)
     await hass.config_entries.async_reload(entry.entry_id)
 
 
-def _get_tracking_data(entry: ConfigEntry) -> list:
-    """Get tracking data from entry data or options."""
-    if entry.options and CONF_TRACKING_NUMBERS in entry.options:
-        data = list(entry.options.get(CONF_TRACKING_NUMBERS, []))
-        _LOGGER.debug("Got tracking data from options: %s", data)
-        return _migrate_tracking_data(data)
+def _get_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    """Get the store holding the saved results of a config entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}")
 
-    data = list(entry.data.get(CONF_TRACKING_NUMBERS, []))
-    _LOGGER.debug("Got tracking data from data: %s", data)
-    return _migrate_tracking_data(data)
 
+def _result_to_dict(result: TrackingResult) -> dict[str, Any]:
+    """Serialize a tracking result for storage (without the raw API response)."""
+    return asdict(replace(result, raw_data=None))
 
-def _migrate_tracking_data(data: list) -> list:
-    """Migrate old tracking number format to new format."""
-    if not data:
-        return []
 
-    # Check if migration is needed (old format: list of strings)
-    if isinstance(data[0], str):
-        _LOGGER.info("Migrating tracking numbers to new format with names")
-        return [
-            {
-                "tracking_number": number,
-                "name": number,
-                "stop_tracking_delivered": False,
-            }
-            for number in data
-        ]
+def _result_from_dict(data: dict[str, Any]) -> TrackingResult:
+    """Rebuild a tracking result saved by _result_to_dict."""
+    latest_event = data.get("latest_event")
+    return TrackingResult(
+        **{
+            **data,
+            "events": [TrackingEvent(**event) for event in data.get("events") or []],
+            "latest_event": TrackingEvent(**latest_event) if latest_event else None,
+        }
+    )
 
-    return data
+
+def _is_unchanged(previous: TrackingResult, result: TrackingResult) -> bool:
+    """Check if a successful result reports the same progress as the previous one.
+
+    Compares the event count and latest event instead of the full event lists.
+    """
+    return (
+        previous.success
+        and previous.status == result.status
+        and len(previous.events) == len(result.events)
+        and previous.latest_event == result.latest_event
+    )
+
+
+def _get_tracking_data(entry: ConfigEntry) -> list:
+    """Get tracking data from entry options or data.
+
+    Entries in older formats are converted by async_migrate_entry before
+    they are set up, so the stored list is used as is.
+    """
+    if entry.options and CONF_TRACKING_NUMBERS in entry.options:
+        return list(entry.options[CONF_TRACKING_NUMBERS])
+    return list(entry.data.get(CONF_TRACKING_NUMBERS, []))
 
 
 def _get_scan_interval(entry: ConfigEntry) -> int:
@@ -150,123 +266,332 @@ class GreekCourierDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Tracking
     def __init__(
         self,
         hass: HomeAssistant,
-        tracking_numbers: list[str],
-        tracking_configs: dict[str, dict],
+        tracking_numbers: Sequence[str],
+        tracking_configs: Mapping[str, dict],
         scan_interval: int,
+        courier_cache: dict[str, str] | None = None,
+        store: Store | None = None,
     ) -> None:
         super().__init__(
             hass,
             logger=logging.getLogger(__name__),
             name=DOMAIN,
-            update_interval=timedelta(hours=scan_interval),
+            update_interval=timedelta(minutes=max(1, scan_interval)),
         )
-        self.tracking_numbers = tracking_numbers
-        self.tracking_configs = tracking_configs
+        # Never mutated after setup - store read-only copies
+        self.tracking_numbers: tuple[str, ...] = tuple(tracking_numbers)
+        self.tracking_configs: Mapping[str, dict] = MappingProxyType(dict(tracking_configs))
+
+        # Resolve per-number settings once so refreshes don't re-read the configs
+        self._stop_when_delivered: dict[str, bool] = {}
+        self._selected_courier: dict[str, str] = {}
+        for number in tracking_numbers:
+            config = tracking_configs.get(number) or {}
+            self._stop_when_delivered[number] = bool(config.get("stop_tracking_delivered", False))
+            self._selected_courier[number] = config.get("courier") or COURIER_AUTO
+
+        # Home Assistant's pooled HTTP session, shared by every courier request
+        # and closed by Home Assistant itself; looked up when first needed
+        self._session: aiohttp.ClientSession | None = None
+
+        # Courier instances for numbers with a selected courier, created on
+        # the first refresh (once the shared session is available)
+        self._couriers: dict[str, BaseCourier] | None = None
+
+        # Couriers detected for auto-detect numbers, so later refreshes skip probing
+        self._courier_cache: dict[str, str] = courier_cache if courier_cache is not None else {}
+
+        # Limit how many numbers are tracked at once to avoid connection storms
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_TRACKING)
+
+        # Monotonic time before which a tracking number is not polled again
+        self._next_poll: dict[str, float] = {}
+
+        # Results are merged into this dict in place and it is returned as the
+        # coordinator data, instead of copying the previous data every refresh
+        self._data_buf: dict[str, TrackingResult] = {}
+
+        # Where results are saved so they survive restarts
+        self._store = store
+
+        # Refresh currently running, shared by overlapping update calls
+        self._inflight: asyncio.Future[dict[str, TrackingResult]] | None = None
         _LOGGER.debug("Coordinator initialized with %d tracking numbers", len(tracking_numbers))
 
+    async def async_restore(self) -> None:
+        """Load the results saved before the last restart.
+
+        Numbers updated recently enough are scheduled as if they had just
+        been polled, so the first refresh skips them.
+        """
+        if self._store is None:
+            return
+
+        stored = await self._store.async_load()
+        if not stored:
+            return
+
+        now = time.monotonic()
+        wall_now = datetime.now(_UTC)
+        for number, saved in stored.get("results", {}).items():
+            # Skip numbers that were removed from the entry since the last save
+            if number not in self._selected_courier:
+                continue
+            try:
+                result = _result_from_dict(saved)
+            except (TypeError, ValueError) as err:
+                _LOGGER.debug("Ignoring saved result for %s: %s", number, err)
+                continue
+
+            self._data_buf[number] = result
+            if not result.last_updated:
+                continue
+
+            if has_tracking_data(result):
+                self._courier_cache.setdefault(number, result.courier)
+            try:
+                age = (wall_now - datetime.fromisoformat(result.last_updated)).total_seconds()
+            except ValueError:
+                continue
+            self._schedule_next_poll(number, result, now - age)
+
+        _LOGGER.debug("Restored %d saved tracking results", len(self._data_buf))
+
+    async def async_warm_up(self) -> None:
+        """Open connections to the couriers of the numbers that are due."""
+        now = time.monotonic()
+        codes: set[str] = set()
+        for number, courier_code in self._selected_courier.items():
+            if now < self._next_poll.get(number, 0.0):
+                continue
+            if courier_code not in COURIER_REGISTRY:
+                courier_code = self._courier_cache.get(number, COURIER_AUTO)
+            if courier_code not in COURIER_REGISTRY:
+                # Auto-detect probes every courier
+                codes.update(COURIER_REGISTRY)
+                break
+            codes.add(courier_code)
+
+        if codes:
+            await warm_up_connections(self._get_session(), codes)
+
+    def _data_to_store(self) -> dict[str, Any]:
+        """Serialize the coordinator data for the store."""
+        return {
+            "results": {
+                number: _result_to_dict(result)
+                for number, result in self._data_buf.items()
+            }
+        }
+
     async def _async_update_data(self) -> dict[str, TrackingResult]:
-        """Fetch latest data for all tracking numbers."""
+        """Fetch latest data for all tracking numbers.
+
+        Overlapping calls (e.g. a manual refresh while a scheduled one is
+        running) wait for the refresh in progress instead of starting another.
+        """
+        if self._inflight is not None:
+            _LOGGER.debug("Refresh already in progress, waiting for it")
+            return await asyncio.shield(self._inflight)
+
+        inflight = self._inflight = asyncio.get_running_loop().create_future()
+        try:
+            data = await self._async_fetch_data()
+        except asyncio.CancelledError:
+            inflight.cancel()
+            raise
+        except Exception as err:
+            inflight.set_exception(err)
+            inflight.exception()  # Mark as retrieved in case nobody is waiting
+            raise
+        else:
+            inflight.set_result(data)
+            return data
+        finally:
+            self._inflight = None
+
+    async def _async_fetch_data(self) -> dict[str, TrackingResult]:
+        """Fetch and merge results for the tracking numbers that are due."""
         if not self.tracking_numbers:
             _LOGGER.warning("No tracking numbers to track")
             return {}
 
-        _LOGGER.debug("Fetching updates for %d tracking numbers", len(self.tracking_numbers))
+        # Checked once per refresh to skip per-number debug logging at normal log levels
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug("Fetching updates for %d tracking numbers", len(self.tracking_numbers))
 
         # Filter out tracking numbers that should be stopped (delivered and stop_tracking_delivered is True)
+        # or that are not due yet (see _schedule_next_poll)
+        now = time.monotonic()
         active_numbers = []
+        stopped_count = 0
+        current_data = self._data_buf
         for number in self.tracking_numbers:
-            config = self.tracking_configs.get(number, {})
-            stop_when_delivered = config.get("stop_tracking_delivered", False) if isinstance(config, dict) else False
-
             # Check current status
-            current_result = self.data.get(number) if self.data else None
+            current_result = current_data.get(number)
 
             # Skip tracking if stop_tracking_delivered is True and already delivered
-            if stop_when_delivered and current_result and current_result.status_category == "delivered":
-                _LOGGER.debug("Skipping tracking for %s (delivered and stop_tracking_delivered is True)", number)
+            if (
+                self._stop_when_delivered[number]
+                and current_result
+                and current_result.status_category == "delivered"
+            ):
+                if debug:
+                    _LOGGER.debug("Skipping tracking for %s (delivered and stop_tracking_delivered is True)", number)
                 # Keep the old result
+                stopped_count += 1
+                continue
+
+            if now < self._next_poll.get(number, 0.0):
                 continue
 
             active_numbers.append(number)
 
         if not active_numbers:
-            _LOGGER.debug("No active tracking numbers to update")
-            return self.data or {}
+            if stopped_count == len(self.tracking_numbers):
+                # Nothing left to track until the entry is reconfigured (which reloads it)
+                _LOGGER.debug("All tracking numbers delivered and stopped, slowing down refreshes")
+                self.update_interval = IDLE_UPDATE_INTERVAL
+            else:
+                _LOGGER.debug("No active tracking numbers to update")
+            return current_data
 
-        async def _track_one(number: str) -> TrackingResult:
-            _LOGGER.debug("Tracking: %s", number)
+        session = self._get_session()
+        if self._couriers is None:
+            self._couriers = self._resolve_couriers(session)
+
+        async def _track_one(number: str) -> tuple[str, TrackingResult | None]:
+            if debug:
+                _LOGGER.debug("Tracking: %s", number)
             try:
-                # Get courier selection from config
-                config = self.tracking_configs.get(number, {})
-                selected_courier = config.get("courier", "auto") if isinstance(config, dict) else "auto"
-
-                if selected_courier and selected_courier != "auto":
-                    # Use the selected courier
-                    from .couriers import get_courier, _track_with_retry
-                    courier = get_courier(selected_courier)
-                    if courier:
-                        _LOGGER.debug("Using selected courier %s for %s", courier.COURIER_NAME, number)
-                        result = await _track_with_retry(courier, number)
-                    else:
-                        _LOGGER.warning("Selected courier %s not found, falling back to auto-detect", selected_courier)
-                        result = await track_with_auto_detect(number)
-                else:
-                    # Auto-detect - try all couriers
-                    result = await track_with_auto_detect(number)
-
-                _LOGGER.debug("Result for %s: success=%s, courier=%s, status=%s",
-                           number, result.success, result.courier, result.status)
-                return result
+                # Time out each number on its own so one slow courier doesn't
+                # throw away the results of the others
+                async with self._semaphore:
+                    result = await asyncio.wait_for(
+                        self._async_track(number, session),
+                        timeout=TRACKING_TIMEOUT,
+                    )
+
+                if debug:
+                    _LOGGER.debug("Result for %s: success=%s, courier=%s, status=%s",
+                               number, result.success, result.courier, result.status)
+                return number, result
+            except asyncio.TimeoutError:
+                _LOGGER.warning("Timeout while tracking %s, keeping previous data", number)
+                return number, None
             except Exception as err:
                 _LOGGER.error("Error tracking %s: %s", number, err, exc_info=True)
                 # Return None to indicate failure - we'll keep the old data
-                return None
+                return number, None
 
-        results: list[TrackingResult | Exception | None]
+        # Merge results with existing data (keep stopped tracking numbers) as
+        # each one completes, so finished tasks can be released right away
+        tasks = {number: asyncio.create_task(_track_one(number)) for number in active_numbers}
         try:
-            async with async_timeout.timeout(60):
-                results = await asyncio.gather(
-                    *[_track_one(number) for number in active_numbers],
-                    return_exceptions=True,
+            for next_result in asyncio.as_completed(tasks.values()):
+                number, result = await next_result
+                self._merge_result(current_data, number, result, now)
+        finally:
+            # Don't leave couriers running if the refresh itself is cancelled
+            for task in tasks.values():
+                task.cancel()
+
+        if self._store is not None:
+            # Debounced, so refreshes in quick succession are written once
+            self._store.async_delay_save(self._data_to_store, STORAGE_SAVE_DELAY)
+
+        _LOGGER.debug("Update complete: %d results", len(current_data))
+        return current_data
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, looking it up on first use."""
+        if self._session is None:
+            self._session = async_get_clientsession(self.hass)
+        return self._session
+
+    def _resolve_couriers(self, session: aiohttp.ClientSession) -> dict[str, BaseCourier]:
+        """Create the courier of every number that doesn't use auto-detect."""
+        couriers: dict[str, BaseCourier] = {}
+        for number, courier_code in self._selected_courier.items():
+            if courier_code == COURIER_AUTO:
+                continue
+            courier = get_courier(courier_code, session)
+            if courier is None:
+                _LOGGER.warning(
+                    "Courier %s not found for %s, falling back to auto-detect",
+                    courier_code,
+                    number,
                 )
-        except asyncio.TimeoutError:
-            _LOGGER.error("Timeout while fetching tracking updates")
-            # Keep existing data on timeout
-            return self.data or {}
-
-        # Merge results with existing data (keep stopped tracking numbers)
-        new_data = dict(self.data or {})
-        for number, result in zip(active_numbers, results):
-            if isinstance(result, Exception):
-                _LOGGER.error("Exception for %s: %s", number, result)
-                # Keep existing data for this tracking number
-                if number not in new_data:
-                    # Only create error result if we don't have any data yet
-                    new_data[number] = TrackingResult(
-                        success=False,
-                        tracking_number=number,
-                        courier="unknown",
-                        courier_name="Unknown Courier",
-                        status="No data available",
-                        status_category="unknown",
-                        events=[],
-                        error_message=str(result),
-                    )
-            elif result is None:
-                # API call failed - keep existing data
-                _LOGGER.warning("API call failed for %s, keeping previous data", number)
-            elif not result.success or result.status in ["Error", "Not Found"]:
-                # API returned error or not found - keep existing data if we have it
-                if number in new_data:
-                    _LOGGER.warning("API returned error for %s, keeping previous data", number)
-                else:
-                    # First time tracking, store the error result
-                    new_data[number] = result
-            else:
-                # Success - update with new data and add timestamp
-                from datetime import datetime, timezone
-                result.last_updated = datetime.now(timezone.utc).isoformat()
-                new_data[number] = result
+                continue
+            couriers[number] = courier
+        return couriers
 
-        _LOGGER.debug("Update complete: %d results", len(new_data))
-        return new_data
+    def _merge_result(
+        self,
+        data: dict[str, TrackingResult],
+        number: str,
+        result: TrackingResult | None,
+        now: float,
+    ) -> None:
+        """Merge a single tracking result into the coordinator data."""
+        if result is None:
+            # API call failed - keep existing data
+            _LOGGER.warning("API call failed for %s, keeping previous data", number)
+            return
+
+        self._schedule_next_poll(number, result, now)
+        if result.success and result.status not in _BAD_STATUSES:
+            # Success - update with new data and add timestamp. The courier is
+            # only remembered once it knows the parcel: an empty page may just
+            # mean the real courier hasn't registered it yet
+            if has_tracking_data(result):
+                self._courier_cache[number] = result.courier
+            last_updated = datetime.now(_UTC).isoformat()
+            previous = data.get(number)
+            if previous is not None and _is_unchanged(previous, result):
+                # Nothing new - keep the existing result, only refresh its timestamp
+                previous.last_updated = last_updated
+                return
+            result.last_updated = last_updated
+            data[number] = result
+        elif number in data:
+            # API returned error or not found - keep existing data
+            _LOGGER.warning("API returned error for %s, keeping previous data", number)
+        else:
+            # First time tracking, store the error result
+            data[number] = result
+
+    def _schedule_next_poll(self, number: str, result: TrackingResult, now: float) -> None:
+        """Back off polling for parcels that are unlikely to change soon."""
+        multiplier = POLL_INTERVAL_MULTIPLIERS.get(result.status_category, 1)
+        interval = self.update_interval.total_seconds() if self.update_interval else 0
+        # Half an interval of slack so scheduler jitter never skips a due refresh
+        self._next_poll[number] = now + interval * (multiplier - 0.5)
+
+    async def _async_track(
+        self,
+        number: str,
+        session: aiohttp.ClientSession,
+    ) -> TrackingResult:
+        """Track a single number, reusing the known courier when possible."""
+        courier = self._couriers.get(number) if self._couriers else None
+        if courier is not None:
+            # Use the selected courier
+            return await _track_with_retry(courier, number)
+
+        cached_courier = self._courier_cache.get(number)
+        if cached_courier in COURIER_REGISTRY:
+            # Courier was detected on a previous refresh - skip probing the others
+            result = await track_with_known_courier(cached_courier, number, session)
+            if has_tracking_data(result):
+                return result
+            _LOGGER.debug(
+                "Cached courier %s failed for %s, falling back to auto-detect",
+                cached_courier,
+                number,
+            )
+            self._courier_cache.pop(number, None)
+
+        # Auto-detect - try all couriers
+        return await track_with_auto_detect(number, session)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-import re
+from functools import lru_cache
 from typing import Any
 
 import voluptuous as vol
@@ -27,10 +27,12 @@ from .const import (
     CONF_TRACKING_NAME,
     CONF_STOP_TRACKING_DELIVERED,
     CONF_COURIER,
+    CONFIG_ENTRY_VERSION,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_NAME,
     DOMAIN,
     CourierType,
+    COURIER_AUTO,
     COURIER_NAMES,
 )
 
@@ -47,31 +49,50 @@ COURIER_LIST = [
     (CourierType.SPEEDEX, COURIER_NAMES[CourierType.SPEEDEX]),
 ]
 
+# Selector options and codes, built once since the courier list never changes
+_COURIER_OPTIONS = tuple({"value": code, "label": name} for code, name in COURIER_LIST)
+_COURIER_CODES = tuple(code for code, _ in COURIER_LIST)
 
-def _migrate_tracking_data(data: list) -> list[dict[str, Any]]:
-    """Migrate old tracking number format to include courier field."""
-    if not data:
-        return []
+# Tracking list labels for the "stop tracking when delivered" setting
+_STOP_STR = "🚫 Stop after delivery"
+_CONT_STR = "✓ Continue tracking"
 
-    # Version 1 -> 2: list of strings to list of dicts
-    if isinstance(data[0], str):
-        _LOGGER.info("Migrating tracking numbers from old format to new format")
-        return [
-            {
-                "tracking_number": number,
-                "name": number,
-                "stop_tracking_delivered": False,
-                "courier": CourierType.AUTO,
-            }
-            for number in data
-        ]
+# Maps commas to newlines so user input can be split with a plain str.split
+_SEP_TRANS = str.maketrans(",", "\n")
 
-    # Version 2 -> 3: add courier field if missing
-    for item in data:
-        if isinstance(item, dict) and "courier" not in item:
-            item["courier"] = CourierType.AUTO
 
-    return data
+@lru_cache(maxsize=1)
+def _courier_selector() -> Any:
+    """Get the courier dropdown shared by all forms."""
+    if HAS_SELECTORS:
+        return SelectSelector(
+            SelectSelectorConfig(
+                options=list(_COURIER_OPTIONS),
+                mode=SelectSelectorMode.DROPDOWN,
+            )
+        )
+    # Fallback for testing: use simple vol.In with list of codes
+    return vol.In(list(_COURIER_CODES))
+
+
+# Schemas of the forms that don't depend on the entry, built once
+_USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_TRACKING_NUMBERS): str,
+        vol.Optional(CONF_TRACKING_NAME, default=""): str,
+        vol.Optional(CONF_COURIER, default=CourierType.AUTO): _courier_selector(),
+        vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): cv.positive_int,
+    }
+)
+_ADD_SCHEMA = vol.Schema({
+    vol.Required("tracking_number"): str,
+    vol.Optional("name", default=""): str,
+    vol.Optional("courier", default=COURIER_AUTO): _courier_selector(),
+    vol.Optional("stop_tracking_delivered", default=False): bool,
+})
+_CONFIRM_DELETE_SCHEMA = vol.Schema({
+    vol.Optional("confirm_delete", default=False): bool,
+})
 
 
 def _parse_tracking_numbers(value: str, courier: str = CourierType.AUTO) -> list[dict[str, Any]]:
@@ -92,7 +113,7 @@ def _parse_tracking_numbers(value: str, courier: str = CourierType.AUTO) -> list
     - stop_tracking_delivered: bool (default False)
     - courier: str (from parameter or AUTO)
     """
-    lines = re.split(r"[,\n]+", value or "")
+    lines = (value or "").translate(_SEP_TRANS).split("\n")
     
     result = []
     seen_numbers = set()
@@ -129,7 +150,7 @@ def _parse_tracking_numbers(value: str, courier: str = CourierType.AUTO) -> list
 class GreekCourierTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Greek Courier Tracker."""
 
-    VERSION = 3  # Version 3: added courier selection
+    VERSION = CONFIG_ENTRY_VERSION
 
     @staticmethod
     def async_get_options_flow(
@@ -172,67 +193,8 @@ class GreekCourierTrackerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return self.async_create_entry(title=DEFAULT_NAME, data=data)
 
         _LOGGER.debug("Showing form to user")
-        
-        # Create courier selector
-        if HAS_SELECTORS:
-            courier_selector = SelectSelector(
-                SelectSelectorConfig(
-                    options=[{"value": code, "label": name} for code, name in COURIER_LIST],
-                    mode=SelectSelectorMode.DROPDOWN,
-                )
-            )
-        else:
-            # Fallback for testing: use simple vol.In with list of codes
-            courier_selector = vol.In([code for code, _ in COURIER_LIST])
-        
-        schema = vol.Schema(
-            {
-                vol.Required(CONF_TRACKING_NUMBERS): str,
-                vol.Optional(CONF_TRACKING_NAME, default=""): str,
-                vol.Optional(CONF_COURIER, default=CourierType.AUTO): courier_selector,
-                vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): cv.positive_int,
-            }
-        )
-        return self.async_show_form(step_id="user", data_schema=schema, errors=errors)
 
-    async def async_migrate_entry(
-        self,
-        config_entry: config_entries.ConfigEntry,
-    ) -> bool:
-        """Migrate old entry to new version."""
-        _LOGGER.info(
-            "Migrating config entry from version %s to %s",
-            config_entry.version,
-            self.VERSION,
-        )
-
-        if config_entry.version < 3:
-            old_data = dict(config_entry.data)
-            old_options = dict(config_entry.options)
-
-            # Migrate tracking_numbers in data
-            if CONF_TRACKING_NUMBERS in old_data:
-                old_data[CONF_TRACKING_NUMBERS] = _migrate_tracking_data(
-                    old_data[CONF_TRACKING_NUMBERS]
-                )
-
-            # Migrate tracking_numbers in options
-            if CONF_TRACKING_NUMBERS in old_options:
-                old_options[CONF_TRACKING_NUMBERS] = _migrate_tracking_data(
-                    old_options[CONF_TRACKING_NUMBERS]
-                )
-
-            self.hass.config_entries.async_update_entry(
-                config_entry,
-                data=old_data,
-                options=old_options,
-                version=self.VERSION,
-            )
-
-            _LOGGER.info("Migration to version %s complete", self.VERSION)
-            return True
-
-        return False
+        return self.async_show_form(step_id="user", data_schema=_USER_SCHEMA, errors=errors)
 
 
 class GreekCourierTrackerOptionsFlow(config_entries.OptionsFlow):
@@ -261,21 +223,26 @@ class GreekCourierTrackerOptionsFlow(config_entries.OptionsFlow):
         # Check if migration is needed
         if existing_numbers and isinstance(existing_numbers[0], str):
             _LOGGER.info("Migrating tracking numbers to new format with names")
-            self.migrated_data = [
-                {
-                    "tracking_number": number,
-                    "name": number,
-                    "stop_tracking_delivered": False,
-                    "courier": CourierType.AUTO,
-                }
-                for number in existing_numbers
-            ]
-        else:
-            # Ensure courier field exists
-            for item in existing_numbers:
-                if isinstance(item, dict) and "courier" not in item:
-                    item["courier"] = CourierType.AUTO
-            self.migrated_data = existing_numbers
+
+        # Normalize every item to a dict with a courier, so the steps below
+        # can read the fields directly
+        self.migrated_data: list[dict[str, Any]] = [
+            item if isinstance(item, dict) else {
+                "tracking_number": item,
+                "name": item,
+                "stop_tracking_delivered": False,
+            }
+            for item in existing_numbers
+        ]
+        for item in self.migrated_data:
+            # Unknown couriers are auto-detected by the coordinator anyway
+            if item.get("courier") not in COURIER_NAMES:
+                item["courier"] = COURIER_AUTO
+
+        # Tracking numbers already configured, for O(1) duplicate checks
+        self._existing_numbers: set[str] = {
+            item["tracking_number"] for item in self.migrated_data
+        }
 
     async def async_step_init(self, user_input: dict[str, Any] | None = None):
         """Manage the options - show list of tracking numbers with actions."""
@@ -308,11 +275,11 @@ class GreekCourierTrackerOptionsFlow(config_entries.OptionsFlow):
         # Build list of tracking numbers for display
         tracking_list = []
         for item in self.migrated_data:
-            tracking_num = item.get("tracking_number", item) if isinstance(item, dict) else item
-            name = item.get("name", tracking_num) if isinstance(item, dict) else tracking_num
-            stop_tracking = item.get("stop_tracking_delivered", False) if isinstance(item, dict) else False
-            courier = item.get("courier", CourierType.AUTO) if isinstance(item, dict) else CourierType.AUTO
-            courier_name = COURIER_NAMES.get(courier, courier)
+            tracking_num = item["tracking_number"]
+            name = item.get("name", tracking_num)
+            stop_tracking = item.get("stop_tracking_delivered", False)
+            courier = item["courier"]
+            courier_name = COURIER_NAMES[courier]
 
             tracking_list.append({
                 "tracking_number": tracking_num,
@@ -324,26 +291,23 @@ class GreekCourierTrackerOptionsFlow(config_entries.OptionsFlow):
         _LOGGER.debug("Showing tracking list: %d items", len(tracking_list))
 
         # Show form with list of tracking numbers and action buttons
-        options_schema = vol.Schema({
+        markers: dict[vol.Marker, Any] = {
             vol.Optional(CONF_SCAN_INTERVAL, default=self.config_entry.options.get(
                 CONF_SCAN_INTERVAL,
                 self.config_entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
             )): cv.positive_int,
-        })
+        }
 
         # Add buttons for each tracking number
-        for i, item in enumerate(tracking_list):
-            options_schema = options_schema.extend({
-                vol.Optional(f"edit_{i}", default=False): bool,
-            })
-            options_schema = options_schema.extend({
-                vol.Optional(f"delete_{i}", default=False): bool,
-            })
+        for i in range(len(tracking_list)):
+            markers[vol.Optional(f"edit_{i}", default=False)] = bool
+            markers[vol.Optional(f"delete_{i}", default=False)] = bool
 
         # Add tracking button
-        options_schema = options_schema.extend({
-            vol.Optional("add_tracking", default=False): bool,
-        })
+        markers[vol.Optional("add_tracking", default=False)] = bool
+
+        # Build the schema once instead of extending (and copying) it per button
+        options_schema = vol.Schema(markers)
 
         return self.async_show_form(
             step_id="init",
@@ -361,17 +325,14 @@ class GreekCourierTrackerOptionsFlow(config_entries.OptionsFlow):
             tracking_number = user_input.get("tracking_number", "").strip().upper()
             name = user_input.get("name", "").strip()
             stop_tracking_delivered = user_input.get("stop_tracking_delivered", False)
-            courier = user_input.get("courier", "auto")
+            courier = user_input.get("courier", COURIER_AUTO)
 
             if not tracking_number:
                 errors["tracking_number"] = "tracking_number_required"
             else:
                 # Check if tracking number already exists
-                for item in self.migrated_data:
-                    existing_number = item.get("tracking_number", item) if isinstance(item, dict) else item
-                    if existing_number == tracking_number:
-                        errors["tracking_number"] = "tracking_number_exists"
-                        break
+                if tracking_number in self._existing_numbers:
+                    errors["tracking_number"] = "tracking_number_exists"
 
                 if not errors:
                     display_name = name if name else tracking_number
@@ -383,6 +344,7 @@ class GreekCourierTrackerOptionsFlow(config_entries.OptionsFlow):
                         "courier": courier,
                     }
                     self.migrated_data.append(new_tracking)
+                    self._existing_numbers.add(tracking_number)
 
                     _LOGGER.info("Added new tracking: %s", new_tracking)
 
@@ -396,28 +358,9 @@ class GreekCourierTrackerOptionsFlow(config_entries.OptionsFlow):
                     }
                     return self.async_create_entry(title="", data=data)
 
-        # Create courier selector
-        if HAS_SELECTORS:
-            courier_selector = SelectSelector(
-                SelectSelectorConfig(
-                    options=[{"value": code, "label": name} for code, name in COURIER_LIST],
-                    mode=SelectSelectorMode.DROPDOWN,
-                )
-            )
-        else:
-            # Fallback for testing: use simple vol.In with list of codes
-            courier_selector = vol.In([code for code, _ in COURIER_LIST])
-
-        schema = vol.Schema({
-            vol.Required("tracking_number"): str,
-            vol.Optional("name", default=""): str,
-            vol.Optional("courier", default="auto"): courier_selector,
-            vol.Optional("stop_tracking_delivered", default=False): bool,
-        })
-
         return self.async_show_form(
             step_id="add_tracking",
-            data_schema=schema,
+            data_schema=_ADD_SCHEMA,
             errors=errors,
         )
 
@@ -429,8 +372,7 @@ class GreekCourierTrackerOptionsFlow(config_entries.OptionsFlow):
         tracking_item = None
         tracking_index = None
         for i, item in enumerate(self.migrated_data):
-            existing_number = item.get("tracking_number", item) if isinstance(item, dict) else item
-            if existing_number == tracking_number:
+            if item["tracking_number"] == tracking_number:
                 tracking_item = item
                 tracking_index = i
                 break
@@ -441,7 +383,7 @@ class GreekCourierTrackerOptionsFlow(config_entries.OptionsFlow):
         if user_input is not None:
             new_name = user_input.get("name", "").strip()
             new_stop_tracking = user_input.get("stop_tracking_delivered", False)
-            new_courier = user_input.get("courier", "auto")
+            new_courier = user_input.get("courier", COURIER_AUTO)
 
             # Update the tracking item
             self.migrated_data[tracking_index] = {
@@ -464,21 +406,11 @@ class GreekCourierTrackerOptionsFlow(config_entries.OptionsFlow):
             return self.async_create_entry(title="", data=data)
 
         # Show edit form with current values
-        current_name = tracking_item.get("name", tracking_number) if isinstance(tracking_item, dict) else tracking_number
-        current_stop_tracking = tracking_item.get("stop_tracking_delivered", False) if isinstance(tracking_item, dict) else False
-        current_courier = tracking_item.get("courier", "auto") if isinstance(tracking_item, dict) else "auto"
-
-        # Create courier selector
-        if HAS_SELECTORS:
-            courier_selector = SelectSelector(
-                SelectSelectorConfig(
-                    options=[{"value": code, "label": name} for code, name in COURIER_LIST],
-                    mode=SelectSelectorMode.DROPDOWN,
-                )
-            )
-        else:
-            # Fallback for testing: use simple vol.In with list of codes
-            courier_selector = vol.In([code for code, _ in COURIER_LIST])
+        current_name = tracking_item.get("name", tracking_number)
+        current_stop_tracking = tracking_item.get("stop_tracking_delivered", False)
+        current_courier = tracking_item["courier"]
+
+        courier_selector = _courier_selector()
 
         schema = vol.Schema({
             vol.Required("name", default=current_name): str,
@@ -503,9 +435,10 @@ class GreekCourierTrackerOptionsFlow(config_entries.OptionsFlow):
             if user_input.get("confirm_delete"):
                 self.migrated_data = [
                     item for item in self.migrated_data
-                    if (item.get("tracking_number", item) if isinstance(item, dict) else item) != tracking_number
+                    if item["tracking_number"] != tracking_number
                 ]
 
+                self._existing_numbers.discard(tracking_number)
                 _LOGGER.info("Deleted tracking number: %s", tracking_number)
 
                 # Save and go back to main menu
@@ -520,19 +453,15 @@ class GreekCourierTrackerOptionsFlow(config_entries.OptionsFlow):
             else:
                 return await self.async_step_init()
 
-        schema = vol.Schema({
-            vol.Optional("confirm_delete", default=False): bool,
-        })
-
         return self.async_show_form(
             step_id="confirm_delete",
-            data_schema=schema,
+            data_schema=_CONFIRM_DELETE_SCHEMA,
             errors=errors,
             description_placeholders={
                 "tracking_number": tracking_number,
                 "name": next(
                     (item.get("name", tracking_number) for item in self.migrated_data
-                     if (item.get("tracking_number", item) if isinstance(item, dict) else item) == tracking_number),
+                     if item["tracking_number"] == tracking_number),
                     tracking_number
                 ),
             }
@@ -543,13 +472,10 @@ class GreekCourierTrackerOptionsFlow(config_entries.OptionsFlow):
         if not tracking_list:
             return "No tracking numbers configured"
 
-        lines = []
-        for item in tracking_list:
-            name = item.get("name", item.get("tracking_number", "Unknown"))
-            tracking_num = item.get("tracking_number", "Unknown")
-            courier = item.get("courier", "Auto")
-            stop_tracking = "🚫 Stop after delivery" if item.get("stop_tracking_delivered") else "✓ Continue tracking"
-
-            lines.append(f"• {name} ({tracking_num}) - {courier} - {stop_tracking}")
-
-        return "\n".join(lines)
+        # Items come from async_step_init with every field (including the
+        # courier display name) already resolved
+        return "\n".join(
+            f"• {item['name']} ({item['tracking_number']}) - {item['courier']} - "
+            f"{_STOP_STR if item['stop_tracking_delivered'] else _CONT_STR}"
+            for item in tracking_list
+        )
@@ -5,6 +5,16 @@ from enum import Enum
 
 DOMAIN: Final = "greek_courier_tracker"
 
+# hass.data key for the tracking_number -> detected courier cache (survives reloads)
+DATA_COURIER_CACHE: Final = f"{DOMAIN}_courier_cache"
+
+# Config entry format version (4: scan interval in minutes, was hours)
+CONFIG_ENTRY_VERSION: Final = 4
+
+# Persisted coordinator results (one store per config entry)
+STORAGE_VERSION: Final = 1
+STORAGE_SAVE_DELAY: Final = 10  # seconds
+
 # Configuration keys
 CONF_TRACKING_NUMBERS: Final = "tracking_numbers"
 CONF_SCAN_INTERVAL: Final = "scan_interval"
@@ -15,9 +25,27 @@ CONF_AUTO_REMOVE_DELIVERED: Final = "auto_remove_delivered"  # Auto-remove deliv
 CONF_STOP_TRACKING_DELIVERED: Final = "stop_tracking_delivered"  # Stop tracking delivered packages
 
 # Default values
-DEFAULT_SCAN_INTERVAL: Final = 1  # hours
+DEFAULT_SCAN_INTERVAL: Final = 30  # minutes
 DEFAULT_NAME: Final = "Greek Courier Tracker"
 
+# Maximum time to spend tracking a single number during a refresh
+TRACKING_TIMEOUT: Final = 60  # seconds
+
+# Maximum number of tracking numbers fetched concurrently during a refresh
+MAX_CONCURRENT_TRACKING: Final = 8
+
+# Most recent events exposed in a sensor's attributes (the count of all is exposed too)
+MAX_EVENT_ATTRIBUTES: Final = 10
+
+# Poll each tracking number every N scan intervals, depending on its status category
+POLL_INTERVAL_MULTIPLIERS: Final[dict[str, int]] = {
+    "in_transit": 1,
+    "created": 4,
+    "unknown": 4,
+    "error": 6,
+    "delivered": 48,  # About once a day at the default interval
+}
+
 
 class CourierType(str, Enum):
     """Supported courier types."""
@@ -30,49 +58,37 @@ class CourierType(str, Enum):
     AUTO = "auto"
 
 
-# Courier display names
+# Plain str value of CourierType.AUTO, compared against stored courier codes
+# without going through the enum
+COURIER_AUTO: Final = "auto"
+
+# Courier display names (plain string keys; CourierType members look up the same)
 COURIER_NAMES: Final[dict[str, str]] = {
-    CourierType.ELTA: "ELTA Courier",
-    CourierType.ACS: "ACS Courier",
-    CourierType.GENIKI: "Geniki Taxydromiki",
-    CourierType.SPEEDEX: "SpeedEx",
-    CourierType.COURIER_CENTER: "Courier Center",
-    CourierType.BOX_NOW: "Box Now",
-    CourierType.AUTO: "Auto-detect (try all)",
+    "elta": "ELTA Courier",
+    "acs": "ACS Courier",
+    "geniki": "Geniki Taxydromiki",
+    "speedex": "SpeedEx",
+    "courier_center": "Courier Center",
+    "box_now": "Box Now",
+    "auto": "Auto-detect (try all)",
 }
 
-# Tracking number patterns for auto-detection
-TRACKING_PATTERNS: Final[dict[str, list[str]]] = {
-    # ELTA: Any 2 letters + 9 digits + GR (e.g., SE, EL, PW, etc.)
-    CourierType.ELTA: [
-        r"^[A-Z]{2}\d{9}GR$",      # XX123456789GR (SE, EL, PW, etc.)
-        r"^GR\d{9}[A-Z]{2}$",      # GR123456789XX (international)
-    ],
-    # ACS: 10 digits
-    CourierType.ACS: [
-        r"^\d{10}$",         # 1234567890
-    ],
-    # Geniki: 10-12 digits or alphanumeric
-    CourierType.GENIKI: [
-        r"^[A-Z]{2}\d{9,11}$",  # GT123456789
-        r"^\d{10,12}$",         # 10-12 digits
-    ],
-    # SpeedEx: SP prefix + digits, or 12 digits
-    CourierType.SPEEDEX: [
-        r"^SP\d{8,10}$",     # SP12345678
-        r"^\d{12}$",         # 12 digits
-        r"^\d{9}[A-Z]{2}$",  # 9 digits + 2 letters
-    ],
-    # Courier Center: 10-12 digits
-    CourierType.COURIER_CENTER: [
-        r"^CC\d{8,10}$",     # CC prefix
-        r"^\d{10,12}$",      # 10-12 digits
-    ],
-    # Box Now: 10 digits (similar to ACS but different API)
-    CourierType.BOX_NOW: [
-        r"^BN\d{8,10}$",     # BN prefix
-    ],
-}
+# Tracking number formats and the couriers that issue them, most specific first:
+# the first format a number matches decides, so the BN/CC/SP prefixes win over
+# Geniki's generic two letters + digits. Digit-only formats are shared by
+# several couriers and don't identify one.
+TRACKING_PATTERNS: Final[tuple[tuple[str, tuple[str, ...]], ...]] = (
+    (r"^BN\d{8,10}\Z", ("box_now",)),            # BN prefix
+    (r"^CC\d{8,10}\Z", ("courier_center",)),     # CC prefix
+    (r"^SP\d{8,10}\Z", ("speedex",)),            # SP12345678
+    (r"^[A-Z]{2}\d{9}GR\Z", ("elta",)),          # XX123456789GR (SE, EL, PW, etc.)
+    (r"^GR\d{9}[A-Z]{2}\Z", ("elta",)),          # GR123456789XX (international)
+    (r"^[A-Z]{2}\d{9,11}\Z", ("geniki",)),       # GT123456789
+    (r"^\d{9}[A-Z]{2}\Z", ("speedex",)),         # 9 digits + 2 letters
+    (r"^\d{10}\Z", ("acs", "geniki", "courier_center", "box_now")),
+    (r"^\d{11}\Z", ("geniki", "courier_center")),
+    (r"^\d{12}\Z", ("geniki", "speedex", "courier_center")),
+)
 
 # Status translations (Greek to English)
 STATUS_TRANSLATIONS: Final[dict[str, str]] = {
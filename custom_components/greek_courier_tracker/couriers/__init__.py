@@ -2,8 +2,16 @@
 
 import asyncio
 import logging
+import re
+import weakref
+from collections.abc import Iterable
+from functools import lru_cache
+from urllib.parse import urlsplit
 
-from .base import BaseCourier, TrackingResult
+import aiohttp
+
+from ..const import TRACKING_PATTERNS
+from .base import BaseCourier, TrackingResult, create_session, pattern_lengths
 from .elta import ELTACourier
 from .acs import ACSCourier
 from .speedex import SpeedExCourier
@@ -21,7 +29,11 @@ __all__ = [
     "GenikiCourier",
     "CourierCenterCourier",
     "get_courier",
+    "detect_courier",
+    "has_tracking_data",
     "track_with_auto_detect",
+    "track_with_known_courier",
+    "warm_up_connections",
     "_track_with_retry",
 ]
 
@@ -38,38 +50,216 @@ COURIER_REGISTRY: dict[str, type[BaseCourier]] = {
 # Maximum retries per courier
 MAX_RETRIES = 3
 
+# Delay before the first retry, doubled on every following attempt
+RETRY_BACKOFF = 0.25  # seconds
+
+# Limit for the requests that open connections ahead of the first refresh
+WARM_UP_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
+# Courier instances, reused per session. Couriers must stay stateless apart
+# from the session they are given, so one instance can track any number.
+_INSTANCES: weakref.WeakKeyDictionary[aiohttp.ClientSession, dict[str, BaseCourier]] = (
+    weakref.WeakKeyDictionary()
+)
+_DEFAULT_INSTANCES: dict[str, BaseCourier] = {}
+
+# Lengths of the formats in TRACKING_PATTERNS, so other numbers skip the regex
+_DETECT_LENGTHS = pattern_lengths(pattern for pattern, _ in TRACKING_PATTERNS)
+
+# One regex with a named group per format, so a single match classifies a number.
+# Tracking numbers are a dozen characters and the branches fail on their first
+# few, so a match costs well under a microsecond; DFA engines such as re2 spend
+# more than that crossing into their C++ bindings.
+_DETECT_RE = re.compile(
+    "|".join(f"(?P<f{index}>{pattern})" for index, (pattern, _) in enumerate(TRACKING_PATTERNS))
+)
+
+# Courier identified by each group of _DETECT_RE (None: shared by several couriers)
+_DETECT_COURIERS: dict[str, str | None] = {
+    f"f{index}": couriers[0] if len(couriers) == 1 else None
+    for index, (_, couriers) in enumerate(TRACKING_PATTERNS)
+}
+
 
-def get_courier(courier_code: str) -> BaseCourier | None:
+def get_courier(
+    courier_code: str,
+    session: aiohttp.ClientSession | None = None,
+) -> BaseCourier | None:
     """Get a courier instance by code.
 
     Args:
         courier_code: The courier code (e.g., 'elta', 'acs')
+        session: Optional shared HTTP session for the courier to use
+
+    Returns:
+        Courier instance (shared by calls with the same session) or None if not found
+    """
+    instances = _DEFAULT_INSTANCES if session is None else _INSTANCES.setdefault(session, {})
+    courier = instances.get(courier_code)
+    if courier is None:
+        courier_class = COURIER_REGISTRY.get(courier_code)
+        if courier_class is None:
+            return None
+        courier = instances[courier_code] = courier_class(session)
+    return courier
+
+
+# Tracked numbers rarely change, so each one is classified once
+@lru_cache(maxsize=256)
+def detect_courier(tracking_number: str) -> str | None:
+    """Detect the courier of a tracking number from its format.
+
+    Args:
+        tracking_number: The tracking number to check
+
+    Returns:
+        The courier code, or None if the format doesn't identify one courier
+    """
+    tn = tracking_number.strip()
+    if _DETECT_LENGTHS is not None and len(tn) not in _DETECT_LENGTHS:
+        return None
+    match = _DETECT_RE.match(tn.upper())
+    return _DETECT_COURIERS[match.lastgroup] if match else None
+
+
+def has_tracking_data(result: TrackingResult) -> bool:
+    """Check if a result shows that the courier knows the shipment.
+
+    A result is considered "found" if:
+    - success is True AND
+    - status is not "Not Found" or "Error" AND
+    - there are events OR a valid status
+
+    An empty results page ("Unknown" without events) doesn't count, the
+    number may belong to a courier that hasn't answered or registered it yet.
+    """
+    return (
+        result.success
+        and result.status not in ["Not Found", "Error"]
+        and (bool(result.events) or result.status not in ["Unknown", ""])
+    )
+
+
+def _request_origin(courier_cls: type[BaseCourier]) -> str | None:
+    """Get the origin (scheme and host) a courier sends its tracking requests to."""
+    url = getattr(courier_cls, "API_URL", None) or getattr(courier_cls, "TRACKING_URL", "")
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}/" if parts.netloc else None
+
+
+async def warm_up_connections(
+    session: aiohttp.ClientSession,
+    courier_codes: Iterable[str],
+) -> None:
+    """Resolve and connect to the hosts of the given couriers ahead of use.
+
+    Sends a HEAD request to each host, so DNS lookups and TLS handshakes
+    land in the session's caches and pool before the first refresh.
+    Failures are ignored - the refresh reports them properly.
+    """
+    origins = {
+        origin
+        for code in courier_codes
+        if (courier_cls := COURIER_REGISTRY.get(code)) is not None
+        and (origin := _request_origin(courier_cls)) is not None
+    }
+
+    async def _head(url: str) -> None:
+        try:
+            async with session.head(url, allow_redirects=False, timeout=WARM_UP_TIMEOUT):
+                pass
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.debug("Warm-up request to %s failed: %s", url, err)
+
+    await asyncio.gather(*(_head(url) for url in origins))
+
+
+async def track_with_known_courier(
+    courier_code: str,
+    tracking_number: str,
+    session: aiohttp.ClientSession | None = None,
+) -> TrackingResult:
+    """Track a shipment with a specific courier.
+
+    Falls back to auto-detection if the courier code is not registered.
+
+    Args:
+        courier_code: The courier code (e.g., 'elta', 'acs')
+        tracking_number: The tracking number to track
+        session: Optional shared HTTP session
 
     Returns:
-        Courier instance or None if not found
+        TrackingResult from the courier
     """
-    courier_class = COURIER_REGISTRY.get(courier_code)
-    if courier_class:
-        return courier_class()
-    return None
+    if session is None:
+        # Keep connections alive across the retries
+        async with create_session() as own_session:
+            return await track_with_known_courier(courier_code, tracking_number, own_session)
+
+    courier = get_courier(courier_code, session)
+    if courier is None:
+        _LOGGER.warning(
+            "Courier %s not found, falling back to auto-detect",
+            courier_code
+        )
+        return await track_with_auto_detect(tracking_number, session)
+
+    _LOGGER.debug(
+        "Using courier %s for %s",
+        courier.COURIER_NAME,
+        tracking_number
+    )
+    return await _track_with_retry(courier, tracking_number)
 
 
-async def track_with_auto_detect(tracking_number: str) -> TrackingResult:
+async def track_with_auto_detect(
+    tracking_number: str,
+    session: aiohttp.ClientSession | None = None,
+) -> TrackingResult:
     """Track a shipment by trying ALL couriers to find the correct one.
 
     This function:
-    1. Tries EVERY courier in the registry
+    1. Tries the courier matching the number's format first, if there is one,
+       otherwise (or if it can't find the number) tries EVERY courier in the
+       registry concurrently
     2. Uses retry logic (up to 3 attempts) for each courier
     3. Returns the first result with valid tracking data (not "Not Found" or "Error")
+       and cancels the couriers that are still running; a result without events and
+       an "Unknown" status only wins if no courier has events, by registry order
 
     Args:
         tracking_number: The tracking number to track
+        session: Optional shared HTTP session reused across couriers
 
     Returns:
         TrackingResult from the first courier that successfully tracks the package
     """
+    if session is None:
+        # One session for every courier tried, instead of one per request
+        async with create_session() as own_session:
+            return await track_with_auto_detect(tracking_number, own_session)
+
     tn = tracking_number.strip().upper()
 
+    # Formats that identify a courier only need that courier
+    courier_code = detect_courier(tn)
+    if courier_code is not None:
+        courier = get_courier(courier_code, session)
+        _LOGGER.debug(
+            "Tracking number %s looks like %s, trying it first",
+            tracking_number,
+            courier.COURIER_NAME
+        )
+        result = await _track_with_retry(courier, tn)
+        if result.success and result.status not in ["Not Found", "Error"]:
+            return result
+        _LOGGER.debug(
+            "%s returned %s for %s, falling back to all couriers",
+            courier.COURIER_NAME,
+            result.status,
+            tracking_number
+        )
+
     _LOGGER.info(
         "Tracking %s - trying ALL %d couriers",
         tracking_number,
@@ -78,35 +268,52 @@ async def track_with_auto_detect(tracking_number: str) -> TrackingResult:
 
     last_result = None
 
-    for courier_code, courier_class in COURIER_REGISTRY.items():
-        courier = courier_class()
-
-        _LOGGER.debug(
-            "Trying %s for tracking number %s",
-            courier.COURIER_NAME,
-            tracking_number
-        )
-
-        result = await _track_with_retry(courier, tn)
-        last_result = result
+    # Successful answers without tracking data (e.g. an empty results page),
+    # by courier code; one is only used if no courier has the shipment
+    empty_results: dict[str, TrackingResult] = {}
+
+    # Query every courier at once so the slowest one bounds the wait,
+    # instead of the sum of all of them
+    tasks = [
+        asyncio.create_task(_track_with_retry(get_courier(courier_code, session), tn))
+        for courier_code in COURIER_REGISTRY
+    ]
+    try:
+        for next_result in asyncio.as_completed(tasks):
+            result = await next_result
+            last_result = result
+
+            # If we got a successful result with actual tracking data, return it
+            if has_tracking_data(result):
+                _LOGGER.info(
+                    "Successfully tracked %s using %s: %s",
+                    tracking_number,
+                    result.courier_name,
+                    result.status
+                )
+                return result
 
-        # If we got a successful result with actual tracking data, return it
-        if result.success and result.status not in ["Not Found", "Error"]:
-            _LOGGER.info(
-                "Successfully tracked %s using %s: %s",
-                tracking_number,
-                courier.COURIER_NAME,
-                result.status
+            if result.success and result.status not in ["Not Found", "Error"]:
+                # A page without rows, keep waiting for a courier with events
+                empty_results[result.courier] = result
+                continue
+
+            # If this courier clearly said "Not Found", wait for the next one
+            _LOGGER.debug(
+                "%s returned %s for %s, waiting for the other couriers",
+                result.courier_name,
+                result.status,
+                tracking_number
             )
-            return result
+    finally:
+        # Stop the couriers that haven't answered yet (no-op for finished ones)
+        for task in tasks:
+            task.cancel()
 
-        # If this courier clearly said "Not Found", try the next one
-        _LOGGER.debug(
-            "%s returned %s for %s, trying next courier",
-            courier.COURIER_NAME,
-            result.status,
-            tracking_number
-        )
+    # Only empty answers - take them in registry order, like a sequential search
+    for courier_code in COURIER_REGISTRY:
+        if courier_code in empty_results:
+            return empty_results[courier_code]
 
     # No courier succeeded - return the last result
     _LOGGER.warning(
@@ -144,22 +351,19 @@ async def _track_with_retry(
 
     for attempt in range(max_retries):
         try:
-            result = await courier.track(tracking_number)
+            # Retry delays are spent outside the courier's request slots
+            async with courier._request_slots:
+                result = await courier.track(tracking_number)
 
-            # Check if we got a successful response
-            # A result is considered "found" if:
-            # - success is True AND
-            # - status is not "Not Found" or "Error" AND
-            # - there are events OR a valid status
-            if result.success and result.status not in ["Not Found", "Error"]:
-                if result.events or result.status not in ["Unknown", ""]:
-                    _LOGGER.debug(
-                        "Successfully tracked %s with %s on attempt %d",
-                        tracking_number,
-                        courier.COURIER_NAME,
-                        attempt + 1
-                    )
-                    return result
+            # Check if we got a successful response with tracking data
+            if has_tracking_data(result):
+                _LOGGER.debug(
+                    "Successfully tracked %s with %s on attempt %d",
+                    tracking_number,
+                    courier.COURIER_NAME,
+                    attempt + 1
+                )
+                return result
 
             # If we got a clear "Not Found" from the courier, don't retry
             if result.success and result.status == "Not Found":
@@ -170,6 +374,16 @@ async def _track_with_retry(
                 )
                 return result
 
+            # Errors like HTTP 4xx would only fail the same way again
+            if not result.retryable:
+                _LOGGER.debug(
+                    "Courier %s returned a non-retryable error for %s: %s",
+                    courier.COURIER_NAME,
+                    tracking_number,
+                    result.error_message
+                )
+                return result
+
             # Log the attempt and continue to retry
             if attempt < max_retries - 1:
                 _LOGGER.debug(
@@ -179,7 +393,7 @@ async def _track_with_retry(
                     courier.COURIER_NAME,
                     result.status
                 )
-                await asyncio.sleep(0.5)  # Small delay between retries
+                await asyncio.sleep(RETRY_BACKOFF * 2**attempt)
             else:
                 _LOGGER.debug(
                     "Final attempt for %s with %s returned: %s",
@@ -199,7 +413,7 @@ async def _track_with_retry(
                 str(err)
             )
             if attempt < max_retries - 1:
-                await asyncio.sleep(0.5)  # Small delay between retries
+                await asyncio.sleep(RETRY_BACKOFF * 2**attempt)
 
     # All retries exhausted
     return TrackingResult(
@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
 import re
+import time
+from types import MappingProxyType
 from typing import Any
 
 import aiohttp
-import async_timeout
 
 from ..const import CourierType
-from .base import BaseCourier, TrackingEvent, TrackingResult
+from .base import REQUEST_TIMEOUT, BaseCourier, TrackingEvent, TrackingResult, is_retryable_status, json_loads
+
+
+def _split_timestamp(timestamp: str) -> tuple[str, str]:
+    """Split an ISO timestamp into its date and HH:MM time."""
+    date_part, sep, rest = timestamp.partition("T")
+    return date_part, rest[:5] if sep else ""
 
 
 class ACSCourier(BaseCourier):
@@ -20,9 +28,21 @@ class ACSCourier(BaseCourier):
     
     API_URL = "https://api.acscourier.net/api/parcels/search/{tracking_number}"
     BASE_URL = "https://www.acscourier.net"
+
+    # Request headers, shared by every request
+    HEADERS = MappingProxyType({
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+        "Accept": "application/json",
+        "Origin": BASE_URL,
+        "Referer": f"{BASE_URL}/",
+        "x-country": "GR",
+        "x-subscription-id": "",
+    })
     
-    # Tracking number patterns (10 digits)
-    PATTERNS = [r"^\d{10}$"]
+    # Status keywords per category, checked in this order
+    DELIVERED_KEYWORDS = ("παραδόθηκε", "delivered")
+    IN_TRANSIT_KEYWORDS = ("διάκριση", "transit")
+    CREATED_KEYWORDS = ("παρελήφθη", "received")
     
     # Status translations
     STATUS_TRANSLATIONS = {
@@ -32,6 +52,32 @@ class ACSCourier(BaseCourier):
         "Η αποστολή δεν βρέθηκε": "Not Found",
     }
 
+    # publicToken assignment in the tracking page's inline script
+    _TOKEN_RE = re.compile(r'publicToken["\']?\s*[:=]\s*["\']([^"\']+)["\']')
+
+    # The token is set near the top of the page, so only this much is scanned first
+    TOKEN_SCAN_BYTES = 64 * 1024
+
+    # How long a fetched public token is reused before fetching a new one
+    TOKEN_TTL = 15 * 60  # seconds
+
+    # Public token shared by every instance, so a fresh one is reused by all
+    _cached_token: str | None = None
+    _token_fetched_at: float = 0.0
+
+    def __init__(self, session: aiohttp.ClientSession | None = None) -> None:
+        """Initialize the courier.
+
+        Args:
+            session: Shared HTTP session to reuse; a temporary one is
+                created per request when not provided
+        """
+        super().__init__(session)
+        # Per instance like the request slots, since a lock is bound to the
+        # event loop that first waits on it. Instances are shared per session,
+        # so concurrent 401s still fetch the token once
+        self._token_lock = asyncio.Lock()
+
     async def track(self, tracking_number: str) -> TrackingResult:
         """Track an ACS shipment.
         
@@ -40,82 +86,96 @@ class ACSCourier(BaseCourier):
         """
         tracking_number = tracking_number.strip()
         
-        # First, try to get a token from the website
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "Accept": "application/json",
-            "Origin": self.BASE_URL,
-            "Referer": f"{self.BASE_URL}/",
-            "x-country": "GR",
-            "x-subscription-id": "",
-        }
+        headers = self.HEADERS
         
+        # Send the token from a previous 401 right away while it is fresh
+        token = self._get_cached_token()
+        if token:
+            headers = {**self.HEADERS, "x-encrypted-key": token}
+
         try:
-            async with aiohttp.ClientSession() as session:
-                # Try the public API without token first
-                async with async_timeout.timeout(30):
-                    url = self.API_URL.format(tracking_number=tracking_number)
-                    async with session.get(url, headers=headers) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            return self._parse_response(tracking_number, data)
-                        elif response.status == 401:
-                            # Token required - try to fetch it
-                            token = await self._fetch_token(session)
-                            if token:
-                                headers["x-encrypted-key"] = token
-                                async with session.get(url, headers=headers) as resp:
-                                    if resp.status == 200:
-                                        data = await resp.json()
-                                        return self._parse_response(tracking_number, data)
+            async with self._get_session() as session:
+                # Try the public API (without a token if none is cached)
+                url = self.API_URL.format(tracking_number=tracking_number)
+                async with session.get(
+                    url, headers=headers, timeout=REQUEST_TIMEOUT
+                ) as response:
+                    if response.status == 200:
+                        data = await response.json(loads=json_loads)
+                        return self._parse_response(tracking_number, data)
+                    elif response.status == 401:
+                        # Token required (or expired) - try to fetch it
+                        token = await self._refresh_token(session, token)
+                        if token:
+                            headers = {**self.HEADERS, "x-encrypted-key": token}
+                            async with session.get(
+                                url, headers=headers, timeout=REQUEST_TIMEOUT
+                            ) as resp:
+                                if resp.status == 200:
+                                    data = await resp.json(loads=json_loads)
+                                    return self._parse_response(tracking_number, data)
                         
-                        return TrackingResult(
-                            success=False,
-                            tracking_number=tracking_number,
-                            courier=self.COURIER_CODE,
-                            courier_name=self.COURIER_NAME,
-                            status="Error",
-                            status_category="error",
-                            events=[],
-                            error_message=f"HTTP error: {response.status}",
-                        )
+                    return self._error_result(
+                        tracking_number,
+                        f"HTTP error: {response.status}",
+                        retryable=is_retryable_status(response.status),
+                    )
                         
         except aiohttp.ClientError as err:
-            return TrackingResult(
-                success=False,
-                tracking_number=tracking_number,
-                courier=self.COURIER_CODE,
-                courier_name=self.COURIER_NAME,
-                status="Error",
-                status_category="error",
-                events=[],
-                error_message=str(err),
-            )
+            return self._error_result(tracking_number, str(err))
         except Exception as err:
-            return TrackingResult(
-                success=False,
-                tracking_number=tracking_number,
-                courier=self.COURIER_CODE,
-                courier_name=self.COURIER_NAME,
-                status="Error",
-                status_category="error",
-                events=[],
-                error_message=f"Unexpected error: {err}",
-            )
+            return self._error_result(tracking_number, f"Unexpected error: {err}")
     
+    @classmethod
+    def _get_cached_token(cls) -> str | None:
+        """Return the shared token if it was fetched within TOKEN_TTL."""
+        if cls._cached_token and time.monotonic() - cls._token_fetched_at < cls.TOKEN_TTL:
+            return cls._cached_token
+        return None
+
+    async def _refresh_token(
+        self,
+        session: aiohttp.ClientSession,
+        rejected_token: str | None,
+    ) -> str | None:
+        """Fetch a new shared token, unless another request just did.
+
+        Args:
+            session: HTTP session to fetch the token with
+            rejected_token: The token the API just rejected, if any
+        """
+        cls = type(self)
+        async with self._token_lock:
+            cached = cls._get_cached_token()
+            if cached and cached != rejected_token:
+                # Refreshed by a concurrent request while we waited
+                return cached
+
+            token = await self._fetch_token(session)
+            cls._cached_token = token
+            cls._token_fetched_at = time.monotonic()
+            return token
+
     async def _fetch_token(self, session: aiohttp.ClientSession) -> str | None:
         """Fetch the dynamic token from ACS website."""
         try:
             async with session.get(
-                f"{self.BASE_URL}/el/myacs/anafores-apostolwn/anazitisi-apostolwn/"
+                f"{self.BASE_URL}/el/myacs/anafores-apostolwn/anazitisi-apostolwn/",
+                timeout=REQUEST_TIMEOUT,
             ) as response:
                 if response.status == 200:
-                    text = await response.text()
-                    # Remove UTF-8 BOM if present
-                    if text.startswith('\ufeff'):
-                        text = text[1:]
-                    # Look for publicToken in the HTML
-                    match = re.search(r'publicToken["\']?\s*[:=]\s*["\']([^"\']+)["\']', text)
+                    # Look for publicToken in the head of the HTML first
+                    head = bytearray()
+                    async for chunk in response.content.iter_chunked(16384):
+                        head += chunk
+                        if len(head) >= self.TOKEN_SCAN_BYTES:
+                            break
+                    # utf-8-sig removes the UTF-8 BOM if present
+                    match = self._TOKEN_RE.search(head.decode("utf-8-sig", errors="ignore"))
+                    if match is None and not response.content.at_eof():
+                        # Not in the head - scan the whole page
+                        head += await response.content.read()
+                        match = self._TOKEN_RE.search(head.decode("utf-8-sig", errors="ignore"))
                     if match:
                         return match.group(1)
         except Exception:
@@ -139,24 +199,18 @@ class ACSCourier(BaseCourier):
         
         parcel = items[0]
         raw_events = parcel.get("statusHistory", [])
-        events = []
-        
-        for event in raw_events:
-            date_str = event.get("controlPointDate", "")
-            # Parse ISO date
-            date_part = date_str.split("T")[0] if "T" in date_str else date_str
-            time_part = date_str.split("T")[1][:5] if "T" in date_str and len(date_str.split("T")) > 1 else ""
-            
-            events.append(TrackingEvent(
-                date=date_part,
-                time=time_part,
+        translate = self.translate_status
+        translations = self.STATUS_TRANSLATIONS
+        events = [
+            TrackingEvent(
+                date=(stamp := _split_timestamp(event.get("controlPointDate", "")))[0],
+                time=stamp[1],
                 location=event.get("controlPoint", ""),
-                status=event.get("description", ""),
-                status_translated=self.translate_status(
-                    event.get("description", ""),
-                    self.STATUS_TRANSLATIONS
-                ),
-            ))
+                status=(description := event.get("description", "")),
+                status_translated=translate(description, translations),
+            )
+            for event in raw_events
+        ]
         
         latest = events[0] if events else None
         is_delivered = parcel.get("isDelivered", False)
@@ -164,9 +218,9 @@ class ACSCourier(BaseCourier):
         status = "Delivered" if is_delivered else (latest.status_translated if latest else "Unknown")
         category = "delivered" if is_delivered else self.get_status_category(
             status,
-            ["παραδόθηκε", "delivered"],
-            ["διάκριση", "transit"],
-            ["παρελήφθη", "received"]
+            self.DELIVERED_KEYWORDS,
+            self.IN_TRANSIT_KEYWORDS,
+            self.CREATED_KEYWORDS,
         )
         
         return TrackingResult(
@@ -178,5 +232,5 @@ class ACSCourier(BaseCourier):
             status_category=category,
             events=events,
             latest_event=latest,
-            raw_data=data,
+            raw_data=data if self.DEBUG_RAW else None,
         )
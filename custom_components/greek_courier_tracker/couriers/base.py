@@ -2,15 +2,222 @@
 
 from __future__ import annotations
 
+import asyncio
+import re
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Collection, Iterable, Sequence
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from functools import lru_cache
+from html import unescape
+from typing import TYPE_CHECKING, Any
 
+import aiohttp
+import orjson
 
-@dataclass
+from ..const import TRACKING_PATTERNS
+
+if TYPE_CHECKING:
+    from bs4 import Tag
+
+# Regex parser, used to work out the lengths a pattern can match
+try:
+    from re import _parser as _sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse as _sre_parse
+
+# Tree builder for the couriers that scrape HTML: lxml's C parser when it is
+# installed (it is a requirement of the integration), else the stdlib one
+try:
+    import lxml  # noqa: F401
+except ImportError:
+    HTML_PARSER = "html.parser"
+else:
+    HTML_PARSER = "lxml"
+
+# aiodns resolves without a thread per lookup; aiohttp only uses it when asked
+try:
+    import aiodns  # noqa: F401
+except ImportError:
+    _HAS_AIODNS = False
+else:
+    _HAS_AIODNS = True
+
+# JSON decoder shared by the couriers (C implementation, much faster than stdlib json)
+json_loads = orjson.loads
+
+
+# Connection pool settings for sessions created by the couriers themselves.
+# aiohttp speaks HTTP/1.1 only, so each concurrent request to a host needs its
+# own connection; the limit bounds how many handshakes a burst can cost, and
+# keep-alive lets the following requests reuse them.
+CONNECTION_LIMIT_PER_HOST = 4
+DNS_CACHE_TTL = 300  # seconds
+
+# Per-request timeout, enforced by aiohttp itself
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=10, sock_read=20)
+
+# Distinct status texts remembered per helper; couriers repeat the same few
+STATUS_CACHE_SIZE = 1024
+
+
+def _lowercase_keys(translations: dict[str, str]) -> dict[str, str]:
+    """Lowercase translation keys, keeping the first entry on collisions."""
+    lowered: dict[str, str] = {}
+    for key, value in translations.items():
+        lowered.setdefault(key.lower(), value)
+    return lowered
+
+
+def _translate(status: str, status_lower: str, lowered: dict[str, str]) -> str:
+    """Translate a status using a table with lowercased keys."""
+    # Check for exact match
+    exact = lowered.get(status_lower)
+    if exact is not None:
+        return exact
+
+    # Check for partial match
+    for greek_lower, english in lowered.items():
+        if greek_lower in status_lower or status_lower in greek_lower:
+            return english
+
+    return status
+
+
+def _categorize(status_lower: str, delivered_keywords: Sequence[str],
+                in_transit_keywords: Sequence[str],
+                created_keywords: Sequence[str]) -> str:
+    """Match a lowercased status against lowercased keywords, in category order."""
+    # Each courier has only a handful of short keywords, so plain substring
+    # checks beat a combined regex or an Aho-Corasick automaton here, and
+    # _categorize_cached already avoids repeating the work per status.
+    for keyword in delivered_keywords:
+        if keyword in status_lower:
+            return "delivered"
+
+    for keyword in in_transit_keywords:
+        if keyword in status_lower:
+            return "in_transit"
+
+    for keyword in created_keywords:
+        if keyword in status_lower:
+            return "created"
+
+    return "unknown"
+
+
+def _lowercase_all(keywords: Sequence[str]) -> tuple[str, ...]:
+    """Lowercase a keyword list."""
+    return tuple(keyword.lower() for keyword in keywords)
+
+
+@lru_cache(maxsize=STATUS_CACHE_SIZE)
+def _translate_cached(courier_cls: type[BaseCourier], status: str) -> str:
+    """Translate a status with a courier's own table, memoized."""
+    return _translate(status, status.lower(), courier_cls._STATUS_TRANSLATIONS_LC)
+
+
+@lru_cache(maxsize=STATUS_CACHE_SIZE)
+def _categorize_cached(courier_cls: type[BaseCourier], status: str) -> str:
+    """Categorize a status with a courier's own keywords, memoized."""
+    return _categorize(status.lower(), *courier_cls._CATEGORY_KEYWORDS_LC)
+
+
+def pattern_lengths(patterns: Iterable[str]) -> range | None:
+    """Range of string lengths the patterns can match (None: unbounded or no patterns)."""
+    widths = [_sre_parse.parse(pattern).getwidth() for pattern in patterns]
+    if not widths or max(high for _, high in widths) >= _sre_parse.MAXREPEAT - 1:
+        return None
+    return range(min(low for low, _ in widths), max(high for _, high in widths) + 1)
+
+
+def html_class_re(class_pattern: str) -> str:
+    """Regex source for a class attribute containing the given class."""
+    return rf'\bclass="(?:[^"]*\s)?(?:{class_pattern})(?:\s[^"]*)?"'
+
+
+def extract_html_blocks(
+    html: str,
+    block_re: re.Pattern[str],
+    field_re: re.Pattern[str],
+) -> list[dict[str, str]] | None:
+    """Pull the text fields of each repeated block out of an HTML page.
+
+    A cheap alternative to building a DOM for pages with a fixed layout.
+    Each block runs from a block_re match (which must not capture) up to
+    the next one, and field_re captures a field name and its text.
+
+    Returns:
+        One dict of stripped field texts per block, or None when a field
+        contains markup or no block has any fields, so the caller can fall
+        back to BeautifulSoup
+    """
+    rows: list[dict[str, str]] = []
+    found = False
+    for block in block_re.split(html)[1:]:
+        fields: dict[str, str] = {}
+        for name, text in field_re.findall(block):
+            if "<" in text:
+                return None
+            fields.setdefault(name, unescape(text).strip())
+        found = found or bool(fields)
+        rows.append(fields)
+    return rows if found else None
+
+
+def soup_fields(block: Tag, attribute: str, names: Collection[str]) -> dict[str, str]:
+    """Collect the stripped text of a block's field divs in a single walk.
+
+    A div is a field when its attribute (e.g. "class" or "id") has one of
+    the given names; like find(), the first div per name wins.
+    """
+    fields: dict[str, str] = {}
+    for div in block.find_all("div"):
+        value = div.get(attribute)
+        if value is None:
+            continue
+        for name in (value,) if isinstance(value, str) else value:
+            if name in names and name not in fields:
+                fields[name] = div.get_text().strip()
+    return fields
+
+
+def is_retryable_status(status: int) -> bool:
+    """Check if an HTTP error status may succeed on retry.
+
+    Server errors, timeouts and rate limits are retried; other client
+    errors will fail the same way again.
+    """
+    return status >= 500 or status in (408, 429)
+
+
+def create_session() -> aiohttp.ClientSession:
+    """Create an HTTP session for when no shared session was provided.
+
+    Inside Home Assistant the coordinator always passes its pooled session,
+    so this only serves standalone calls. Such sessions live for one call
+    rather than at module level, where they would outlive their event loop
+    and never be closed.
+    """
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit_per_host=CONNECTION_LIMIT_PER_HOST,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            resolver=aiohttp.AsyncResolver() if _HAS_AIODNS else None,
+        ),
+        timeout=REQUEST_TIMEOUT,
+    )
+
+
+@dataclass(slots=True)
 class TrackingEvent:
-    """Represents a single tracking event."""
+    """Represents a single tracking event.
+
+    Slotted like TrackingResult, but not frozen: frozen dataclasses set
+    every field through object.__setattr__, which makes building the
+    events of a response several times slower.
+    """
     date: str
     time: str | None
     location: str
@@ -18,9 +225,13 @@ class TrackingEvent:
     status_translated: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TrackingResult:
-    """Result of a tracking request."""
+    """Result of a tracking request.
+
+    Slotted, since results stay in the coordinator data for the lifetime of
+    the integration and their fields are read on every refresh.
+    """
     success: bool
     tracking_number: str
     courier: str
@@ -30,8 +241,9 @@ class TrackingResult:
     events: list[TrackingEvent]
     latest_event: TrackingEvent | None = None
     error_message: str | None = None
-    raw_data: dict[str, Any] | None = None
+    raw_data: dict[str, Any] | None = None  # Only set when BaseCourier.DEBUG_RAW is on
     last_updated: str | None = None  # ISO timestamp of last successful update
+    retryable: bool = True  # False when retrying can't help (e.g. HTTP 4xx)
 
 
 class BaseCourier(ABC):
@@ -40,7 +252,106 @@ class BaseCourier(ABC):
     # Subclasses must define these
     COURIER_CODE: str = ""
     COURIER_NAME: str = ""
-    
+
+    # This courier's formats from TRACKING_PATTERNS, compiled when the class is created
+    PATTERNS: tuple[re.Pattern[str], ...] = ()
+
+    # Lengths PATTERNS can match, worked out from them and checked before
+    # running the regex (None: any)
+    NUMBER_LENGTHS: range | None = None
+
+    # PATTERNS joined into one regex, so a number is matched in a single call
+    _PATTERNS_RE: re.Pattern[str] | None = None
+
+    # Keywords passed to get_status_category, defined by subclasses
+    DELIVERED_KEYWORDS: tuple[str, ...] = ()
+    IN_TRANSIT_KEYWORDS: tuple[str, ...] = ()
+    CREATED_KEYWORDS: tuple[str, ...] = ()
+
+    # Requests a courier instance runs at once. Instances are shared per
+    # session (see get_courier), so this caps every caller hitting the site;
+    # it matches CONNECTION_LIMIT_PER_HOST, which Home Assistant's shared
+    # session doesn't apply
+    MAX_CONCURRENT_REQUESTS: int = CONNECTION_LIMIT_PER_HOST
+
+    # Keep the full API response on results (raw_data), for debugging only;
+    # results live for as long as the integration runs
+    DEBUG_RAW: bool = False
+
+    # STATUS_TRANSLATIONS and the category keywords lowercased, built once per subclass
+    _STATUS_TRANSLATIONS_LC: dict[str, str] = {}
+    _CATEGORY_KEYWORDS_LC: tuple[tuple[str, ...], ...] = ((), (), ())
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.PATTERNS = tuple(
+            re.compile(pattern)
+            for pattern, couriers in TRACKING_PATTERNS
+            if cls.COURIER_CODE in couriers
+        )
+        cls.NUMBER_LENGTHS = pattern_lengths(pattern.pattern for pattern in cls.PATTERNS)
+        if cls.PATTERNS:
+            cls._PATTERNS_RE = re.compile(
+                "|".join(f"(?:{pattern.pattern})" for pattern in cls.PATTERNS)
+            )
+        cls._CATEGORY_KEYWORDS_LC = (
+            _lowercase_all(cls.DELIVERED_KEYWORDS),
+            _lowercase_all(cls.IN_TRANSIT_KEYWORDS),
+            _lowercase_all(cls.CREATED_KEYWORDS),
+        )
+        translations = getattr(cls, "STATUS_TRANSLATIONS", None)
+        if translations is not None:
+            cls._STATUS_TRANSLATIONS_LC = _lowercase_keys(translations)
+
+    def __init__(self, session: aiohttp.ClientSession | None = None) -> None:
+        """Initialize the courier.
+
+        Args:
+            session: Shared HTTP session to reuse; a temporary one is
+                created per request when not provided
+        """
+        self._session = session
+        self._request_slots = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+
+    @asynccontextmanager
+    async def _get_session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """Yield the shared HTTP session, or a temporary one if none was given."""
+        if self._session is not None:
+            yield self._session
+            return
+
+        async with create_session() as session:
+            yield session
+
+    @classmethod
+    def matches_tracking_number(cls, tracking_number: str) -> bool:
+        """Check if a tracking number has one of this courier's formats."""
+        tn = tracking_number.strip()
+        if cls._PATTERNS_RE is None or (
+            cls.NUMBER_LENGTHS is not None and len(tn) not in cls.NUMBER_LENGTHS
+        ):
+            return False
+        return cls._PATTERNS_RE.match(tn.upper()) is not None
+
+    def _error_result(
+        self,
+        tracking_number: str,
+        message: str,
+        retryable: bool = True,
+    ) -> TrackingResult:
+        """Build the result of a failed tracking request."""
+        return TrackingResult(
+            success=False,
+            tracking_number=tracking_number,
+            courier=self.COURIER_CODE,
+            courier_name=self.COURIER_NAME,
+            status="Error",
+            status_category="error",
+            events=[],
+            error_message=message,
+            retryable=retryable,
+        )
+
     @abstractmethod
     async def track(self, tracking_number: str) -> TrackingResult:
         """Track a shipment by tracking number.
@@ -63,23 +374,19 @@ class BaseCourier(ABC):
         Returns:
             Translated status or original if no translation found
         """
-        status_lower = status.lower()
-        
-        # Check for exact match
-        for greek, english in translations.items():
-            if greek.lower() == status_lower:
-                return english
-        
-        # Check for partial match
-        for greek, english in translations.items():
-            if greek.lower() in status_lower or status_lower in greek.lower():
-                return english
-        
-        return status
+        # Statuses usually match a key exactly, which needs no lowercasing
+        exact = translations.get(status)
+        if exact is not None:
+            return exact
+
+        courier_cls = type(self)
+        if translations is getattr(courier_cls, "STATUS_TRANSLATIONS", None):
+            return _translate_cached(courier_cls, status)
+        return _translate(status, status.lower(), _lowercase_keys(translations))
     
-    def get_status_category(self, status: str, delivered_keywords: list[str], 
-                           in_transit_keywords: list[str], 
-                           created_keywords: list[str]) -> str:
+    def get_status_category(self, status: str, delivered_keywords: Sequence[str],
+                           in_transit_keywords: Sequence[str],
+                           created_keywords: Sequence[str]) -> str:
         """Determine the status category from status text.
         
         Args:
@@ -91,21 +398,19 @@ class BaseCourier(ABC):
         Returns:
             Category string: delivered, in_transit, created, or unknown
         """
-        status_lower = status.lower()
-        
-        for keyword in delivered_keywords:
-            if keyword.lower() in status_lower:
-                return "delivered"
-        
-        for keyword in in_transit_keywords:
-            if keyword.lower() in status_lower:
-                return "in_transit"
-        
-        for keyword in created_keywords:
-            if keyword.lower() in status_lower:
-                return "created"
-        
-        return "unknown"
+        courier_cls = type(self)
+        if (
+            delivered_keywords is courier_cls.DELIVERED_KEYWORDS
+            and in_transit_keywords is courier_cls.IN_TRANSIT_KEYWORDS
+            and created_keywords is courier_cls.CREATED_KEYWORDS
+        ):
+            return _categorize_cached(courier_cls, status)
+        return _categorize(
+            status.lower(),
+            _lowercase_all(delivered_keywords),
+            _lowercase_all(in_transit_keywords),
+            _lowercase_all(created_keywords),
+        )
     
     def parse_date(self, date_str: str, formats: list[str] | None = None) -> datetime | None:
         """Parse a date string into a datetime object.
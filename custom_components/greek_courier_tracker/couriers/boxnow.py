@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-import re
+from types import MappingProxyType
 from typing import Any
 
 import aiohttp
-import async_timeout
+import orjson
 
 from ..const import CourierType
-from .base import BaseCourier, TrackingEvent, TrackingResult
+from .base import REQUEST_TIMEOUT, BaseCourier, TrackingEvent, TrackingResult, is_retryable_status, json_loads
 
 
 class BoxNowCourier(BaseCourier):
@@ -20,11 +20,20 @@ class BoxNowCourier(BaseCourier):
     
     API_URL = "https://api-production.boxnow.gr/api/v1/parcels:track"
     BASE_URL = "https://boxnow.gr"
+
+    # Request headers, shared by every request
+    HEADERS = MappingProxyType({
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+        "Accept": "application/json",
+        "Content-Type": "application/json",
+        "Origin": BASE_URL,
+        "Referer": f"{BASE_URL}/",
+    })
     
-    # Tracking number patterns
-    PATTERNS = [
-        r"^\d{10}$",       # 10 digits (Box Now format)
-    ]
+    # Status keywords per category, checked in this order
+    DELIVERED_KEYWORDS = ("delivered",)
+    IN_TRANSIT_KEYWORDS = ("depot", "destination")
+    CREATED_KEYWORDS = ("new",)
 
     # Event type translations
     EVENT_TRANSLATIONS = {
@@ -40,59 +49,29 @@ class BoxNowCourier(BaseCourier):
         """Track a Box Now shipment."""
         tracking_number = tracking_number.strip()
         
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-            "Origin": self.BASE_URL,
-            "Referer": f"{self.BASE_URL}/",
-        }
-        
         try:
-            async with aiohttp.ClientSession() as session:
-                async with async_timeout.timeout(30):
-                    async with session.post(
-                        self.API_URL,
-                        json={"parcelId": tracking_number},
-                        headers=headers,
-                    ) as response:
-                        if response.status != 200:
-                            return TrackingResult(
-                                success=False,
-                                tracking_number=tracking_number,
-                                courier=self.COURIER_CODE,
-                                courier_name=self.COURIER_NAME,
-                                status="Error",
-                                status_category="error",
-                                events=[],
-                                error_message=f"HTTP error: {response.status}",
-                            )
+            async with self._get_session() as session:
+                async with session.post(
+                    self.API_URL,
+                    # Encoded here, so the body doesn't depend on the session's serializer
+                    data=orjson.dumps({"parcelId": tracking_number}),
+                    headers=self.HEADERS,
+                    timeout=REQUEST_TIMEOUT,
+                ) as response:
+                    if response.status != 200:
+                        return self._error_result(
+                            tracking_number,
+                            f"HTTP error: {response.status}",
+                            retryable=is_retryable_status(response.status),
+                        )
                         
-                        data = await response.json()
-                        return self._parse_response(tracking_number, data)
+                    data = await response.json(loads=json_loads)
+                    return self._parse_response(tracking_number, data)
                         
         except aiohttp.ClientError as err:
-            return TrackingResult(
-                success=False,
-                tracking_number=tracking_number,
-                courier=self.COURIER_CODE,
-                courier_name=self.COURIER_NAME,
-                status="Error",
-                status_category="error",
-                events=[],
-                error_message=str(err),
-            )
+            return self._error_result(tracking_number, str(err))
         except Exception as err:
-            return TrackingResult(
-                success=False,
-                tracking_number=tracking_number,
-                courier=self.COURIER_CODE,
-                courier_name=self.COURIER_NAME,
-                status="Error",
-                status_category="error",
-                events=[],
-                error_message=f"Unexpected error: {err}",
-            )
+            return self._error_result(tracking_number, f"Unexpected error: {err}")
     
     def _parse_response(self, tracking_number: str, data: dict[str, Any]) -> TrackingResult:
         """Parse the Box Now API response."""
@@ -112,25 +91,23 @@ class BoxNowCourier(BaseCourier):
         parcel = parcels[0]
         raw_events = parcel.get("events", [])
         events = []
+        append = events.append
+        translate = self.EVENT_TRANSLATIONS.get
         
         for event in raw_events:
             create_time = event.get("createTime", "")
             # Parse ISO timestamp: "2025-01-15T13:55:32.015Z"
-            date_part = create_time.split("T")[0] if "T" in create_time else create_time
-            time_part = ""
-            if "T" in create_time:
-                time_part = create_time.split("T")[1][:8]  # HH:MM:SS
+            date_part, _, rest = create_time.partition("T")
+            time_part = rest[:8]  # HH:MM:SS, empty without a time
             
             event_type = event.get("type", "")
             
-            events.append(TrackingEvent(
+            append(TrackingEvent(
                 date=date_part,
                 time=time_part,
                 location=event.get("locationDisplayName", ""),
                 status=event_type,
-                status_translated=self.EVENT_TRANSLATIONS.get(
-                    event_type, event_type
-                ),
+                status_translated=translate(event_type, event_type),
             ))
         
         latest = events[0] if events else None
@@ -139,9 +116,9 @@ class BoxNowCourier(BaseCourier):
         
         category = "delivered" if state == "delivered" else self.get_status_category(
             status,
-            ["delivered"],
-            ["depot", "destination"],
-            ["new"]
+            self.DELIVERED_KEYWORDS,
+            self.IN_TRANSIT_KEYWORDS,
+            self.CREATED_KEYWORDS,
         )
         
         return TrackingResult(
@@ -153,5 +130,5 @@ class BoxNowCourier(BaseCourier):
             status_category=category,
             events=events,
             latest_event=latest,
-            raw_data=data,
+            raw_data=data if self.DEBUG_RAW else None,
         )
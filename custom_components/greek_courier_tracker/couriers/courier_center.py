@@ -2,15 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
 import re
+from types import MappingProxyType
 from typing import Any
 
 import aiohttp
-import async_timeout
 from bs4 import BeautifulSoup
 
 from ..const import CourierType
-from .base import BaseCourier, TrackingEvent, TrackingResult
+from .base import (
+    HTML_PARSER,
+    REQUEST_TIMEOUT,
+    BaseCourier,
+    TrackingEvent,
+    TrackingResult,
+    extract_html_blocks,
+    html_class_re,
+    is_retryable_status,
+    soup_fields,
+)
 
 
 class CourierCenterCourier(BaseCourier):
@@ -20,11 +31,23 @@ class CourierCenterCourier(BaseCourier):
     COURIER_NAME = "Courier Center"
     
     TRACKING_URL = "https://courier.gr/track/result"
+
+    # Request headers, shared by every request
+    HEADERS = MappingProxyType({
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    })
     
-    # Tracking number patterns
-    PATTERNS = [
-        r"^\d{10,12}$",    # 10-12 digits (Courier Center format)
-    ]
+    # Status keywords per category, checked in this order
+    DELIVERED_KEYWORDS = ("deliverycompleted", "delivered")
+    IN_TRANSIT_KEYWORDS = ("intransit", "transit")
+    CREATED_KEYWORDS = ("received", "new")
+
+    # Tracking rows, their fields and the overall status box of the results page
+    _ROW_RE = re.compile(rf"<div\b[^>]*{html_class_re('tr')}[^>]*>")
+    _FIELD_RE = re.compile(r'<div\b[^>]*\bid="(date|time|area|action)"[^>]*>(.*?)</div>', re.S)
+    _STATUS_RE = re.compile(rf"<div\b[^>]*{html_class_re('status')}[^>]*>(.*?)</div>", re.S)
+    _SOUP_FIELDS = frozenset(("date", "time", "area", "action"))
 
     # Status translations
     STATUS_TRANSLATIONS = {
@@ -39,64 +62,66 @@ class CourierCenterCourier(BaseCourier):
         tracking_number = tracking_number.strip().upper()
         
         params = {"tracknr": tracking_number}
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with async_timeout.timeout(30):
-                    async with session.get(
-                        self.TRACKING_URL,
-                        params=params,
-                        headers=headers,
-                    ) as response:
-                        if response.status != 200:
-                            return TrackingResult(
-                                success=False,
-                                tracking_number=tracking_number,
-                                courier=self.COURIER_CODE,
-                                courier_name=self.COURIER_NAME,
-                                status="Error",
-                                status_category="error",
-                                events=[],
-                                error_message=f"HTTP error: {response.status}",
-                            )
-
-                        html = await response.text()
-                        # Remove UTF-8 BOM if present
-                        if html.startswith('\ufeff'):
-                            html = html[1:]
-                        return self._parse_html(tracking_number, html)
+            async with self._get_session() as session:
+                async with session.get(
+                    self.TRACKING_URL,
+                    params=params,
+                    headers=self.HEADERS,
+                    timeout=REQUEST_TIMEOUT,
+                ) as response:
+                    if response.status != 200:
+                        return self._error_result(
+                            tracking_number,
+                            f"HTTP error: {response.status}",
+                            retryable=is_retryable_status(response.status),
+                        )
+
+                    # Remove UTF-8 BOM if present
+                    html = (await response.text()).removeprefix("\ufeff")
+
+                # Parse off the event loop, once the connection is released
+                return await asyncio.to_thread(self._parse_html, tracking_number, html)
                         
         except aiohttp.ClientError as err:
-            return TrackingResult(
-                success=False,
-                tracking_number=tracking_number,
-                courier=self.COURIER_CODE,
-                courier_name=self.COURIER_NAME,
-                status="Error",
-                status_category="error",
-                events=[],
-                error_message=str(err),
-            )
+            return self._error_result(tracking_number, str(err))
         except Exception as err:
-            return TrackingResult(
-                success=False,
-                tracking_number=tracking_number,
-                courier=self.COURIER_CODE,
-                courier_name=self.COURIER_NAME,
-                status="Error",
-                status_category="error",
-                events=[],
-                error_message=f"Unexpected error: {err}",
-            )
+            return self._error_result(tracking_number, f"Unexpected error: {err}")
     
     def _parse_html(self, tracking_number: str, html: str) -> TrackingResult:
-        """Parse Courier Center HTML response."""
-        soup = BeautifulSoup(html, "html.parser")
-        
+        """Parse Courier Center HTML response.
+
+        The rows are pulled out with regexes; pages that don't fit the
+        expected layout (including error pages) go through BeautifulSoup.
+        """
+        rows = None
+        if 'class="error"' not in html:
+            rows = extract_html_blocks(html, self._ROW_RE, self._FIELD_RE)
+        status_match = self._STATUS_RE.search(html) if rows is not None else None
+        if rows is None or (status_match is not None and "<" in status_match.group(1)):
+            return self._parse_soup(tracking_number, BeautifulSoup(html, HTML_PARSER))
+
+        translate = self.translate_status
+        translations = self.STATUS_TRANSLATIONS
+        events = [
+            TrackingEvent(
+                date=date,
+                time=row.get("time", ""),
+                location=row.get("area", ""),
+                status=(status := row.get("action", "")),
+                status_translated=translate(status, translations),
+            )
+            # Skip header row, and only add rows with valid data
+            for row in rows[1:]
+            if (date := row.get("date"))
+        ]
+
+        is_delivered = status_match is not None and "DeliveryCompleted" in status_match.group(1)
+        return self._build_result(tracking_number, events, is_delivered)
+
+    def _parse_soup(self, tracking_number: str, soup: BeautifulSoup) -> TrackingResult:
+        """Parse a Courier Center page that doesn't fit the regex extraction."""
         # Check for error message
         if soup.find("h4", {"class": "error"}):
             return TrackingResult(
@@ -116,39 +141,39 @@ class CourierCenterCourier(BaseCourier):
         
         # Skip header row
         for row in rows[1:]:
-            date_elem = row.find("div", {"id": "date"})
-            date = date_elem.text.strip() if date_elem else ""
-            
-            time_elem = row.find("div", {"id": "time"})
-            time = time_elem.text.strip() if time_elem else ""
-            
-            area_elem = row.find("div", {"id": "area"})
-            location = area_elem.text.strip() if area_elem else ""
-            
-            action_elem = row.find("div", {"id": "action"})
-            status = action_elem.text.strip() if action_elem else ""
+            fields = soup_fields(row, "id", self._SOUP_FIELDS)
+            date = fields.get("date", "")
             
             if date:  # Only add if we have valid data
+                status = fields.get("action", "")
                 events.append(TrackingEvent(
                     date=date,
-                    time=time,
-                    location=location,
+                    time=fields.get("time", ""),
+                    location=fields.get("area", ""),
                     status=status,
                     status_translated=self.translate_status(status, self.STATUS_TRANSLATIONS),
                 ))
         
-        latest = events[0] if events else None
-        status = latest.status_translated if latest else "Unknown"
-        
         # Check for delivery status
         status_div = soup.find("div", {"class": "status"})
-        is_delivered = status_div and "DeliveryCompleted" in status_div.text
+        is_delivered = bool(status_div and "DeliveryCompleted" in status_div.text)
+        return self._build_result(tracking_number, events, is_delivered)
+
+    def _build_result(
+        self,
+        tracking_number: str,
+        events: list[TrackingEvent],
+        is_delivered: bool,
+    ) -> TrackingResult:
+        """Build the tracking result from the parsed events."""
+        latest = events[0] if events else None
+        status = latest.status_translated if latest else "Unknown"
         
         category = "delivered" if is_delivered else self.get_status_category(
             status,
-            ["deliverycompleted", "delivered"],
-            ["intransit", "transit"],
-            ["received", "new"]
+            self.DELIVERED_KEYWORDS,
+            self.IN_TRANSIT_KEYWORDS,
+            self.CREATED_KEYWORDS,
         )
         
         return TrackingResult(
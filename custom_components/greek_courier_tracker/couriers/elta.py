@@ -2,14 +2,13 @@
 
 from __future__ import annotations
 
-import re
+from types import MappingProxyType
 from typing import Any
 
 import aiohttp
-import async_timeout
 
 from ..const import CourierType
-from .base import BaseCourier, TrackingEvent, TrackingResult
+from .base import REQUEST_TIMEOUT, BaseCourier, TrackingEvent, TrackingResult, is_retryable_status, json_loads
 
 
 class ELTACourier(BaseCourier):
@@ -20,13 +19,19 @@ class ELTACourier(BaseCourier):
     
     API_URL = "https://www.elta-courier.gr/track.php"
     BASE_URL = "https://www.elta-courier.gr"
+
+    # Request headers, shared by every request
+    HEADERS = MappingProxyType({
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+        "Accept": "application/json",
+        "Origin": BASE_URL,
+        "Content-Type": "application/x-www-form-urlencoded",
+    })
     
-    # Tracking number patterns
-    # ELTA uses various 2-letter prefixes (SE, EL, PW, etc.) + 9 digits + GR
-    PATTERNS = [
-        r"^[A-Z]{2}\d{9}GR$",      # XX123456789GR (SE, EL, PW, etc.)
-        r"^GR\d{9}[A-Z]{2}$",      # GR123456789XX (international)
-    ]
+    # Status keywords per category, checked in this order
+    DELIVERED_KEYWORDS = ("παραδόθηκε", "delivered")
+    IN_TRANSIT_KEYWORDS = ("μεταφοράς", "transit")
+    CREATED_KEYWORDS = ("δημιουργία", "created", "συ.δε.τα.")
     
     # Status translations
     STATUS_TRANSLATIONS = {
@@ -41,107 +46,67 @@ class ELTACourier(BaseCourier):
         """Track an ELTA shipment."""
         tracking_number = tracking_number.strip().upper()
         
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "Accept": "application/json",
-            "Origin": self.BASE_URL,
-            "Referer": f"{self.BASE_URL}/search?br={tracking_number}",
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
+        # The referer is the only header that depends on the tracking number
+        headers = {**self.HEADERS, "Referer": f"{self.BASE_URL}/search?br={tracking_number}"}
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with async_timeout.timeout(30):
-                    async with session.post(
-                        self.API_URL,
-                        data=f"number={tracking_number}&s=0",
-                        headers=headers,
-                    ) as response:
-                        if response.status != 200:
-                            return TrackingResult(
-                                success=False,
-                                tracking_number=tracking_number,
-                                courier=self.COURIER_CODE,
-                                courier_name=self.COURIER_NAME,
-                                status="Error",
-                                status_category="error",
-                                events=[],
-                                error_message=f"HTTP error: {response.status}",
-                            )
+            async with self._get_session() as session:
+                async with session.post(
+                    self.API_URL,
+                    data=f"number={tracking_number}&s=0",
+                    headers=headers,
+                    timeout=REQUEST_TIMEOUT,
+                ) as response:
+                    if response.status != 200:
+                        return self._error_result(
+                            tracking_number,
+                            f"HTTP error: {response.status}",
+                            retryable=is_retryable_status(response.status),
+                        )
                         
-                        # ELTA API returns JSON with wrong content-type (text/html)
-                        # Use text() then parse manually, handling potential UTF-8 BOM
-                        text = await response.text()
-                        # Remove UTF-8 BOM if present and parse JSON
-                        import json
-                        if text.startswith('\ufeff'):
-                            text = text[1:]  # Remove BOM
-                        result = json.loads(text)
-                        return self._parse_response(tracking_number, result)
+                    # ELTA API returns JSON with wrong content-type (text/html)
+                    # Use text() then parse manually, removing a UTF-8 BOM if present
+                    result = json_loads((await response.text()).removeprefix("\ufeff"))
+
+                # Build the events once the response and its text can be freed
+                return self._parse_response(tracking_number, result)
                         
         except aiohttp.ClientError as err:
-            return TrackingResult(
-                success=False,
-                tracking_number=tracking_number,
-                courier=self.COURIER_CODE,
-                courier_name=self.COURIER_NAME,
-                status="Error",
-                status_category="error",
-                events=[],
-                error_message=str(err),
-            )
+            return self._error_result(tracking_number, str(err))
         except Exception as err:
-            return TrackingResult(
-                success=False,
-                tracking_number=tracking_number,
-                courier=self.COURIER_CODE,
-                courier_name=self.COURIER_NAME,
-                status="Error",
-                status_category="error",
-                events=[],
-                error_message=f"Unexpected error: {err}",
-            )
+            return self._error_result(tracking_number, f"Unexpected error: {err}")
     
     def _parse_response(self, tracking_number: str, data: dict[str, Any]) -> TrackingResult:
         """Parse the ELTA API response."""
         if data.get("status") != 1:
-            return TrackingResult(
-                success=False,
-                tracking_number=tracking_number,
-                courier=self.COURIER_CODE,
-                courier_name=self.COURIER_NAME,
-                status="Error",
-                status_category="error",
-                events=[],
-                error_message=data.get("result", "Unknown error"),
+            return self._error_result(
+                tracking_number, data.get("result", "Unknown error")
             )
         
         tracking_data = data.get("result", {}).get(tracking_number, {})
         
         if tracking_data.get("status") == 1:
             raw_events = tracking_data.get("result", [])
-            events = []
-            
-            for event in raw_events:
-                translated = self.translate_status(
-                    event.get("status", ""),
-                    self.STATUS_TRANSLATIONS
-                )
-                events.append(TrackingEvent(
+            translate = self.translate_status
+            translations = self.STATUS_TRANSLATIONS
+            events = [
+                TrackingEvent(
                     date=event.get("date", ""),
                     time=event.get("time", ""),
                     location=event.get("place", ""),
-                    status=event.get("status", ""),
-                    status_translated=translated,
-                ))
+                    status=(status := event.get("status", "")),
+                    status_translated=translate(status, translations),
+                )
+                for event in raw_events
+            ]
             
             latest = events[0] if events else None
             status = latest.status_translated if latest else "Unknown"
             category = self.get_status_category(
                 status,
-                ["παραδόθηκε", "delivered"],
-                ["μεταφοράς", "transit"],
-                ["δημιουργία", "created", "συ.δε.τα."]
+                self.DELIVERED_KEYWORDS,
+                self.IN_TRANSIT_KEYWORDS,
+                self.CREATED_KEYWORDS,
             )
             
             return TrackingResult(
@@ -153,7 +118,7 @@ class ELTACourier(BaseCourier):
                 status_category=category,
                 events=events,
                 latest_event=latest,
-                raw_data=data,
+                raw_data=data if self.DEBUG_RAW else None,
             )
         
         elif tracking_data.get("status") == 2:
@@ -2,15 +2,31 @@
 
 from __future__ import annotations
 
+import asyncio
 import re
+from types import MappingProxyType
 from typing import Any
 
 import aiohttp
-import async_timeout
 from bs4 import BeautifulSoup
 
 from ..const import CourierType
-from .base import BaseCourier, TrackingEvent, TrackingResult
+from .base import (
+    HTML_PARSER,
+    REQUEST_TIMEOUT,
+    BaseCourier,
+    TrackingEvent,
+    TrackingResult,
+    extract_html_blocks,
+    html_class_re,
+    is_retryable_status,
+    soup_fields,
+)
+
+
+def _event_date(date_text: str) -> str:
+    """Drop the weekday from a checkpoint date (format: "Δευτέρα, 15/01/2025")."""
+    return date_text.split(", ")[-1] if ", " in date_text else date_text
 
 
 class GenikiCourier(BaseCourier):
@@ -20,12 +36,29 @@ class GenikiCourier(BaseCourier):
     COURIER_NAME = "Geniki Taxydromiki"
     
     TRACKING_URL = "https://www.taxydromiki.com/track/{tracking_number}"
+
+    # Request headers, shared by every request
+    HEADERS = MappingProxyType({
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "el-GR,el;q=0.9,en;q=0.8",
+    })
     
-    # Tracking number patterns
-    PATTERNS = [
-        r"^\d{10,12}$",       # 10-12 digits (Geniki format)
-    ]
+    # Status keywords per category, checked in this order
+    DELIVERED_KEYWORDS = ("παραδοσ", "delivered")
+    IN_TRANSIT_KEYWORDS = ("μεταφορ", "transit")
+    CREATED_KEYWORDS = ("παραλαβ", "picked")
     
+    # Tracking checkpoints and their fields on the results page
+    _CHECKPOINT_RE = re.compile(rf"<div\b[^>]*{html_class_re('tracking-checkpoint')}[^>]*>")
+    _FIELD_RE = re.compile(
+        rf"<div\b[^>]*{html_class_re('checkpoint-(status|location|date|time)')}[^>]*>(.*?)</div>",
+        re.S,
+    )
+    _SOUP_FIELDS = frozenset(
+        ("checkpoint-status", "checkpoint-location", "checkpoint-date", "checkpoint-time")
+    )
+
     # Status translations
     STATUS_TRANSLATIONS = {
         "ΠΑΡΑΔΟΣΗ": "Delivered",
@@ -40,61 +73,59 @@ class GenikiCourier(BaseCourier):
         tracking_number = tracking_number.strip().upper()
         
         url = self.TRACKING_URL.format(tracking_number=tracking_number)
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "el-GR,el;q=0.9,en;q=0.8",
-        }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with async_timeout.timeout(30):
-                    async with session.get(url, headers=headers) as response:
-                        if response.status != 200:
-                            return TrackingResult(
-                                success=False,
-                                tracking_number=tracking_number,
-                                courier=self.COURIER_CODE,
-                                courier_name=self.COURIER_NAME,
-                                status="Error",
-                                status_category="error",
-                                events=[],
-                                error_message=f"HTTP error: {response.status}",
-                            )
-
-                        html = await response.text()
-                        # Remove UTF-8 BOM if present
-                        if html.startswith('\ufeff'):
-                            html = html[1:]
-                        return self._parse_html(tracking_number, html)
+            async with self._get_session() as session:
+                async with session.get(
+                    url, headers=self.HEADERS, timeout=REQUEST_TIMEOUT
+                ) as response:
+                    if response.status != 200:
+                        return self._error_result(
+                            tracking_number,
+                            f"HTTP error: {response.status}",
+                            retryable=is_retryable_status(response.status),
+                        )
+
+                    # Remove UTF-8 BOM if present
+                    html = (await response.text()).removeprefix("\ufeff")
+
+                # Parse off the event loop, once the connection is released
+                return await asyncio.to_thread(self._parse_html, tracking_number, html)
                         
         except aiohttp.ClientError as err:
-            return TrackingResult(
-                success=False,
-                tracking_number=tracking_number,
-                courier=self.COURIER_CODE,
-                courier_name=self.COURIER_NAME,
-                status="Error",
-                status_category="error",
-                events=[],
-                error_message=str(err),
-            )
+            return self._error_result(tracking_number, str(err))
         except Exception as err:
-            return TrackingResult(
-                success=False,
-                tracking_number=tracking_number,
-                courier=self.COURIER_CODE,
-                courier_name=self.COURIER_NAME,
-                status="Error",
-                status_category="error",
-                events=[],
-                error_message=f"Unexpected error: {err}",
-            )
+            return self._error_result(tracking_number, f"Unexpected error: {err}")
     
     def _parse_html(self, tracking_number: str, html: str) -> TrackingResult:
-        """Parse Geniki HTML response."""
-        soup = BeautifulSoup(html, "html.parser")
-        
+        """Parse Geniki HTML response.
+
+        The checkpoints are pulled out with regexes; pages that don't fit
+        the expected layout (including "not found" pages) go through
+        BeautifulSoup.
+        """
+        rows = None
+        if "empty-text" not in html:
+            rows = extract_html_blocks(html, self._CHECKPOINT_RE, self._FIELD_RE)
+        if rows is None:
+            return self._parse_soup(tracking_number, BeautifulSoup(html, HTML_PARSER))
+
+        translate = self.translate_status
+        translations = self.STATUS_TRANSLATIONS
+        events = [
+            TrackingEvent(
+                date=_event_date(row.get("date", "")),
+                time=row.get("time", ""),
+                location=row.get("location", ""),
+                status=(status := row.get("status", "")),
+                status_translated=translate(status, translations),
+            )
+            for row in rows
+        ]
+        return self._build_result(tracking_number, events)
+
+    def _parse_soup(self, tracking_number: str, soup: BeautifulSoup) -> TrackingResult:
+        """Parse a Geniki page that doesn't fit the regex extraction."""
         # Check for "not found" message
         if soup.find("div", {"class": "empty-text"}):
             return TrackingResult(
@@ -113,36 +144,29 @@ class GenikiCourier(BaseCourier):
         checkpoints = soup.find_all("div", {"class": "tracking-checkpoint"})
         
         for checkpoint in checkpoints:
-            status_elem = checkpoint.find("div", {"class": "checkpoint-status"})
-            status = status_elem.text.strip() if status_elem else ""
-            
-            location_elem = checkpoint.find("div", {"class": "checkpoint-location"})
-            location = location_elem.text.strip() if location_elem else ""
-            
-            date_elem = checkpoint.find("div", {"class": "checkpoint-date"})
-            date_text = date_elem.text.strip() if date_elem else ""
-            # Format: "Δευτέρα, 15/01/2025"
-            date = date_text.split(", ")[-1] if ", " in date_text else date_text
-            
-            time_elem = checkpoint.find("div", {"class": "checkpoint-time"})
-            time = time_elem.text.strip() if time_elem else ""
+            fields = soup_fields(checkpoint, "class", self._SOUP_FIELDS)
+            status = fields.get("checkpoint-status", "")
             
             events.append(TrackingEvent(
-                date=date,
-                time=time,
-                location=location,
+                date=_event_date(fields.get("checkpoint-date", "")),
+                time=fields.get("checkpoint-time", ""),
+                location=fields.get("checkpoint-location", ""),
                 status=status,
                 status_translated=self.translate_status(status, self.STATUS_TRANSLATIONS),
             ))
         
+        return self._build_result(tracking_number, events)
+
+    def _build_result(self, tracking_number: str, events: list[TrackingEvent]) -> TrackingResult:
+        """Build the tracking result from the parsed events."""
         latest = events[0] if events else None
         status = latest.status_translated if latest else "Unknown"
         
         category = self.get_status_category(
             status,
-            ["παραδοσ", "delivered"],
-            ["μεταφορ", "transit"],
-            ["παραλαβ", "picked"]
+            self.DELIVERED_KEYWORDS,
+            self.IN_TRANSIT_KEYWORDS,
+            self.CREATED_KEYWORDS,
         )
         
         return TrackingResult(
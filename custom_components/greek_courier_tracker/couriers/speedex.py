@@ -2,15 +2,41 @@
 
 from __future__ import annotations
 
+import asyncio
 import re
+from types import MappingProxyType
 from typing import Any
 
 import aiohttp
-import async_timeout
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from ..const import CourierType
-from .base import BaseCourier, TrackingEvent, TrackingResult
+from .base import (
+    HTML_PARSER,
+    REQUEST_TIMEOUT,
+    BaseCourier,
+    TrackingEvent,
+    TrackingResult,
+    extract_html_blocks,
+    html_class_re,
+    is_retryable_status,
+)
+
+
+# Card info line: "Αθήνα, 15/01/2025 στις 14:30" (the time is optional)
+_INFO_RE = re.compile(r"([^,]+),\s*(\S+)(?:\s+στις\s+(\S+))?")
+
+# Status of the card that marks a delivered shipment (the page is uppercase)
+_DELIVERED_STATUS = "Η ΑΠΟΣΤΟΛΗ ΠΑΡΑΔΟΘΗΚΕ"
+
+
+def _split_info(info_text: str) -> tuple[str, str, str]:
+    """Split a card's info line into location, date and time."""
+    match = _INFO_RE.match(info_text)
+    if match is None:
+        return "", "", ""
+    location, date, time = match.groups("")
+    return location, date, time
 
 
 class SpeedExCourier(BaseCourier):
@@ -20,13 +46,32 @@ class SpeedExCourier(BaseCourier):
     COURIER_NAME = "SpeedEx"
     
     TRACKING_URL = "http://www.speedex.gr/speedex/NewTrackAndTrace.aspx"
+
+    # Request headers, shared by every request
+    HEADERS = MappingProxyType({
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    })
     
-    # Tracking number patterns
-    PATTERNS = [
-        r"^\d{12}$",         # 12 digits
-        r"^\d{9}[A-Z]{2}$",  # 9 digits + 2 letters
-    ]
+    # Status keywords per category, checked in this order
+    DELIVERED_KEYWORDS = ("παραδόθηκ", "delivered")
+    IN_TRANSIT_KEYWORDS = ("μεταφορ", "transit")
+    CREATED_KEYWORDS = ("παραλαβή", "picked")
     
+    # Timeline cards and their fields on the results page
+    _CARD_RE = re.compile(rf"<div\b[^>]*{html_class_re('timeline-card')}[^>]*>")
+    _FIELD_RE = re.compile(
+        rf"<(?:h4|span)\b[^>]*{html_class_re('(card-title|font-small-3)')}[^>]*>(.*?)</(?:h4|span)>",
+        re.S,
+    )
+
+    # The only parts of the page that BeautifulSoup reads: timeline cards and the
+    # "not found" alert. The class is matched with a regex because the
+    # strainer may see the whole class attribute rather than single classes.
+    _STRAINER = SoupStrainer(
+        "div", attrs={"class": re.compile(r"(?:^|\s)(?:timeline-card|alert-warning)(?:\s|$)")}
+    )
+
     # Status translations
     STATUS_TRANSLATIONS = {
         "Η ΑΠΟΣΤΟΛΗ ΠΑΡΑΔΟΘΗΚΕ": "Delivered",
@@ -40,64 +85,68 @@ class SpeedExCourier(BaseCourier):
         tracking_number = tracking_number.strip().upper()
         
         params = {"number": tracking_number}
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with async_timeout.timeout(30):
-                    async with session.get(
-                        self.TRACKING_URL,
-                        params=params,
-                        headers=headers,
-                    ) as response:
-                        if response.status != 200:
-                            return TrackingResult(
-                                success=False,
-                                tracking_number=tracking_number,
-                                courier=self.COURIER_CODE,
-                                courier_name=self.COURIER_NAME,
-                                status="Error",
-                                status_category="error",
-                                events=[],
-                                error_message=f"HTTP error: {response.status}",
-                            )
-
-                        html = await response.text()
-                        # Remove UTF-8 BOM if present
-                        if html.startswith('\ufeff'):
-                            html = html[1:]
-                        return self._parse_html(tracking_number, html)
+            async with self._get_session() as session:
+                async with session.get(
+                    self.TRACKING_URL,
+                    params=params,
+                    headers=self.HEADERS,
+                    timeout=REQUEST_TIMEOUT,
+                ) as response:
+                    if response.status != 200:
+                        return self._error_result(
+                            tracking_number,
+                            f"HTTP error: {response.status}",
+                            retryable=is_retryable_status(response.status),
+                        )
+
+                    # Decoded once with the charset the page declares, since both
+                    # parse paths work on str; remove UTF-8 BOM if present
+                    html = (await response.text()).removeprefix("\ufeff")
+
+                # Parse off the event loop, once the connection is released
+                return await asyncio.to_thread(self._parse_html, tracking_number, html)
                         
         except aiohttp.ClientError as err:
-            return TrackingResult(
-                success=False,
-                tracking_number=tracking_number,
-                courier=self.COURIER_CODE,
-                courier_name=self.COURIER_NAME,
-                status="Error",
-                status_category="error",
-                events=[],
-                error_message=str(err),
-            )
+            return self._error_result(tracking_number, str(err))
         except Exception as err:
-            return TrackingResult(
-                success=False,
-                tracking_number=tracking_number,
-                courier=self.COURIER_CODE,
-                courier_name=self.COURIER_NAME,
-                status="Error",
-                status_category="error",
-                events=[],
-                error_message=f"Unexpected error: {err}",
-            )
+            return self._error_result(tracking_number, f"Unexpected error: {err}")
     
     def _parse_html(self, tracking_number: str, html: str) -> TrackingResult:
-        """Parse SpeedEx HTML response."""
-        soup = BeautifulSoup(html, "html.parser")
-        
+        """Parse SpeedEx HTML response.
+
+        The timeline cards are pulled out with regexes; pages that don't fit
+        the expected layout (including "not found" pages) go through
+        BeautifulSoup.
+        """
+        rows = None
+        if "alert-warning" not in html:
+            rows = extract_html_blocks(html, self._CARD_RE, self._FIELD_RE)
+        if rows is None:
+            soup = BeautifulSoup(html, HTML_PARSER, parse_only=self._STRAINER)
+            return self._parse_soup(tracking_number, soup)
+
+        translate = self.translate_status
+        translations = self.STATUS_TRANSLATIONS
+        events = []
+        is_delivered = False
+        for row in rows:
+            status = row.get("card-title", "")
+            if status == _DELIVERED_STATUS:
+                is_delivered = True
+            location, date, time = _split_info(row.get("font-small-3", ""))
+            events.append(TrackingEvent(
+                date=date,
+                time=time,
+                location=location,
+                status=status,
+                status_translated=translate(status, translations),
+            ))
+        return self._build_result(tracking_number, events, is_delivered)
+
+    def _parse_soup(self, tracking_number: str, soup: BeautifulSoup) -> TrackingResult:
+        """Parse a SpeedEx page that doesn't fit the regex extraction."""
         # Check for "not found" message
         if soup.find("div", {"class": "alert-warning"}):
             return TrackingResult(
@@ -111,6 +160,7 @@ class SpeedExCourier(BaseCourier):
             )
         
         events = []
+        is_delivered = False
         
         # Find timeline cards
         cards = soup.find_all("div", {"class": "timeline-card"})
@@ -119,28 +169,12 @@ class SpeedExCourier(BaseCourier):
             # Get status description
             title_elem = card.find("h4", {"class": "card-title"})
             status = title_elem.text.strip() if title_elem else ""
+            if status == _DELIVERED_STATUS:
+                is_delivered = True
             
             # Get location and date/time
             info_elem = card.find("span", {"class": "font-small-3"})
-            info_text = info_elem.text.strip() if info_elem else ""
-            
-            # Parse: "Αθήνα, 15/01/2025 στις 14:30"
-            location = ""
-            date = ""
-            time = ""
-            
-            if info_text:
-                parts = info_text.split(", ")
-                if len(parts) >= 2:
-                    location = parts[0]
-                    date_time = parts[1]
-                    # Parse date and time
-                    if "στις" in date_time:
-                        date_part, time_part = date_time.split(" στις ")
-                        date = date_part.strip()
-                        time = time_part.strip()
-                    else:
-                        date = date_time
+            location, date, time = _split_info(info_elem.text.strip() if info_elem else "")
             
             events.append(TrackingEvent(
                 date=date,
@@ -150,20 +184,23 @@ class SpeedExCourier(BaseCourier):
                 status_translated=self.translate_status(status, self.STATUS_TRANSLATIONS),
             ))
         
+        return self._build_result(tracking_number, events, is_delivered)
+
+    def _build_result(
+        self,
+        tracking_number: str,
+        events: list[TrackingEvent],
+        is_delivered: bool,
+    ) -> TrackingResult:
+        """Build the tracking result from the parsed events."""
         latest = events[0] if events else None
         status = latest.status_translated if latest else "Unknown"
         
-        # Check if delivered
-        is_delivered = any(
-            e.status.upper() == "Η ΑΠΟΣΤΟΛΗ ΠΑΡΑΔΟΘΗΚΕ" 
-            for e in events
-        )
-        
         category = "delivered" if is_delivered else self.get_status_category(
             status,
-            ["παραδόθηκ", "delivered"],
-            ["μεταφορ", "transit"],
-            ["παραλαβή", "picked"]
+            self.DELIVERED_KEYWORDS,
+            self.IN_TRANSIT_KEYWORDS,
+            self.CREATED_KEYWORDS,
         )
         
         return TrackingResult(
@@ -6,15 +6,11 @@ from typing import Any
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import (
-    CONF_TRACKING_NUMBERS,
-    CONF_TRACKING_NAME,
-    DOMAIN,
-)
+from .const import DOMAIN, MAX_EVENT_ATTRIBUTES
 from .couriers.base import TrackingEvent, TrackingResult
 from . import GreekCourierDataUpdateCoordinator
 
@@ -27,47 +23,27 @@ async def async_setup_entry(
     """Set up sensors for each tracking number."""
     coordinator: GreekCourierDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    # Get tracking data with names
-    tracking_data = _get_tracking_data(entry)
-
+    # Tracking numbers and their settings, already migrated by the integration setup
     sensors = [
         GreekCourierTrackingSensor(
             coordinator,
             entry,
-            tracking_number=item.get("tracking_number", item) if isinstance(item, dict) else item,
-            tracking_name=item.get("name", item) if isinstance(item, dict) else item,
-            stop_tracking_delivered=item.get("stop_tracking_delivered", False) if isinstance(item, dict) else False,
+            tracking_number=number,
+            tracking_name=config.get("name", number),
+            stop_tracking_delivered=config.get("stop_tracking_delivered", False),
         )
-        for item in tracking_data
+        for number, config in coordinator.tracking_configs.items()
     ]
     async_add_entities(sensors)
 
 
-def _get_tracking_data(entry: ConfigEntry) -> list:
-    """Get tracking data from entry data or options."""
-    # Try options first (where updates are stored), then data
-    tracking_data = entry.options.get(
-        CONF_TRACKING_NUMBERS,
-        entry.data.get(CONF_TRACKING_NUMBERS, [])
-    )
-
-    # Migrate old format (list of strings) to new format (list of dicts)
-    if tracking_data and isinstance(tracking_data[0], str):
-        return [
-            {
-                "tracking_number": number,
-                "name": number,
-                "stop_tracking_delivered": False,
-            }
-            for number in tracking_data
-        ]
-
-    return tracking_data
-
-
 class GreekCourierTrackingSensor(CoordinatorEntity, SensorEntity):
     """Representation of a tracking sensor."""
 
+    # No __slots__: the Home Assistant entity base classes don't define them
+    # and keep their cached properties in the instance __dict__, so every
+    # sensor has a __dict__ regardless
+
     def __init__(
         self,
         coordinator: GreekCourierDataUpdateCoordinator,
@@ -87,6 +63,23 @@ class GreekCourierTrackingSensor(CoordinatorEntity, SensorEntity):
         # Set entity_id with greek_courier_tracker prefix
         self._attr_has_entity_name = True
         self.entity_id = f"sensor.greek_courier_tracker_{tracking_number.lower()}"
+        # Attributes built for the last result and its last_updated, which the
+        # coordinator refreshes in place when a result is unchanged
+        self._attrs_cache: tuple[TrackingResult, str | None, dict[str, Any]] | None = None
+        # Result for this number, looked up once per coordinator update rather
+        # than by every property on each state write
+        self._result = self._lookup_result()
+
+    async def async_added_to_hass(self) -> None:
+        """Pick up results from refreshes that ran before the sensor was added."""
+        await super().async_added_to_hass()
+        self._result = self._lookup_result()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Look up the new result before the state is written."""
+        self._result = self._lookup_result()
+        super()._handle_coordinator_update()
 
     @property
     def native_value(self) -> str | None:
@@ -119,8 +112,12 @@ class GreekCourierTrackingSensor(CoordinatorEntity, SensorEntity):
         if result is None:
             return {}
 
+        cached = self._attrs_cache
+        if cached is not None and cached[0] is result and cached[1] == result.last_updated:
+            return cached[2]
+
         latest = result.latest_event
-        return {
+        attrs = {
             "tracking_number": result.tracking_number,
             "courier": result.courier,
             "courier_name": result.courier_name,
@@ -129,13 +126,17 @@ class GreekCourierTrackingSensor(CoordinatorEntity, SensorEntity):
             "latest_date": latest.date if latest else None,
             "latest_time": latest.time if latest else None,
             "latest_place": latest.location if latest else None,
-            "events": _serialize_events(result.events),
+            # Events are newest first; the full history stays in the coordinator
+            "events": _serialize_events(result.events[:MAX_EVENT_ATTRIBUTES]),
+            "events_total": len(result.events),
             "delivered": result.status_category == "delivered",
             "stop_tracking_delivered": self._stop_tracking_delivered,
             "tracking_stopped": self._stop_tracking_delivered and result.status_category == "delivered",
             "error_message": result.error_message,
             "last_updated": result.last_updated,
         }
+        self._attrs_cache = (result, result.last_updated, attrs)
+        return attrs
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -153,12 +154,17 @@ class GreekCourierTrackingSensor(CoordinatorEntity, SensorEntity):
         return True
 
     def _get_result(self) -> TrackingResult | None:
+        return self._result
+
+    def _lookup_result(self) -> TrackingResult | None:
         data = self.coordinator.data or {}
         return data.get(self._tracking_number)
 
 
 def _serialize_events(events: list[TrackingEvent]) -> list[dict[str, Any]]:
     """Serialize TrackingEvent objects to dictionaries."""
+    # A dict display over the slotted fields is the fastest form here,
+    # faster than attrgetter/zip or dataclasses.asdict
     return [
         {
             "date": event.date,
@@ -124,7 +124,7 @@ if [ "$SHELL" = true ]; then
     docker run --rm -it \
         -v "$PROJECT_ROOT/custom_components:/app/custom_components:ro" \
         -v "$(PWD):/app/tests:ro" \
-        -v "$(PWD)/pytest.ini:/app/pytest.ini:ro" \
+        -v "$PROJECT_ROOT/pytest.ini:/app/pytest.ini:ro" \
         -e PYTHONPATH=/app \
         greek-courier-tracker-test:latest \
         /bin/sh
@@ -134,7 +134,7 @@ elif [ "$COVERAGE" = true ]; then
     docker run --rm \
         -v "$PROJECT_ROOT/custom_components:/app/custom_components:ro" \
         -v "$(PWD):/app/tests:ro" \
-        -v "$(PWD)/pytest.ini:/app/pytest.ini:ro" \
+        -v "$PROJECT_ROOT/pytest.ini:/app/pytest.ini:ro" \
         -v "$(PWD)/htmlcov:/app/htmlcov" \
         -e PYTHONPATH=/app \
         greek-courier-tracker-test:latest
@@ -148,7 +148,7 @@ else
     docker run --rm \
         -v "$PROJECT_ROOT/custom_components:/app/custom_components:ro" \
         -v "$(PWD):/app/tests:ro" \
-        -v "$(PWD)/pytest.ini:/app/pytest.ini:ro" \
+        -v "$PROJECT_ROOT/pytest.ini:/app/pytest.ini:ro" \
         -e PYTHONPATH=/app \
         greek-courier-tracker-test:latest
 fi
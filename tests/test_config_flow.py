@@ -4,27 +4,62 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 
+@pytest.fixture(autouse=True)
+def mock_setup_entry():
+    """Keep flows that create or reload entries from setting up the integration."""
+    with patch(
+        "custom_components.greek_courier_tracker.async_setup_entry", return_value=True
+    ) as setup_entry, patch(
+        "custom_components.greek_courier_tracker.async_unload_entry", return_value=True
+    ):
+        yield setup_entry
+
+
+@pytest.fixture
+def empty_entry():
+    """Config entry without any tracking numbers."""
+    entry = MagicMock(spec_set=["entry_id", "options", "data"])
+    entry.entry_id = "test_entry"
+    entry.options = {
+        "tracking_numbers": [],
+        "scan_interval": 30,
+    }
+    entry.data = {}
+    return entry
+
+
+@pytest.fixture
+def entry_with_tracking():
+    """Config entry already tracking 1234567890 with auto-detect."""
+    entry = MagicMock(spec_set=["entry_id", "options", "data"])
+    entry.entry_id = "test_entry"
+    entry.options = {
+        "tracking_numbers": [
+            {
+                "tracking_number": "1234567890",
+                "name": "My Package",
+                "stop_tracking_delivered": False,
+                "courier": "auto",
+            }
+        ],
+        "scan_interval": 30,
+    }
+    entry.data = {}
+    return entry
+
+
 class TestCourierDropdown:
     """Tests for the courier dropdown functionality."""
 
     @pytest.mark.asyncio
-    async def test_add_tracking_saves_courier_selection(self):
+    async def test_add_tracking_saves_courier_selection(self, empty_entry):
         """Test that courier selection is properly saved when adding tracking."""
         from custom_components.greek_courier_tracker.config_flow import (
             GreekCourierTrackerOptionsFlow,
         )
 
-        # Create a mock config entry
-        mock_entry = MagicMock()
-        mock_entry.entry_id = "test_entry"
-        mock_entry.options = {
-            "tracking_numbers": [],
-            "scan_interval": 30,
-        }
-        mock_entry.data = {}
-
         # Create options flow
-        flow = GreekCourierTrackerOptionsFlow(mock_entry)
+        flow = GreekCourierTrackerOptionsFlow(empty_entry)
 
         # Submit the form with a specific courier selected
         result = await flow.async_step_add_tracking(
@@ -47,21 +82,13 @@ class TestCourierDropdown:
         assert tracking_numbers[0]["tracking_number"] == "1234567890"
 
     @pytest.mark.asyncio
-    async def test_add_tracking_default_courier_is_auto(self):
+    async def test_add_tracking_default_courier_is_auto(self, empty_entry):
         """Test that courier defaults to 'auto' when not specified."""
         from custom_components.greek_courier_tracker.config_flow import (
             GreekCourierTrackerOptionsFlow,
         )
 
-        mock_entry = MagicMock()
-        mock_entry.entry_id = "test_entry"
-        mock_entry.options = {
-            "tracking_numbers": [],
-            "scan_interval": 30,
-        }
-        mock_entry.data = {}
-
-        flow = GreekCourierTrackerOptionsFlow(mock_entry)
+        flow = GreekCourierTrackerOptionsFlow(empty_entry)
 
         # Submit without specifying courier (should default to auto)
         result = await flow.async_step_add_tracking(
@@ -78,30 +105,14 @@ class TestCourierDropdown:
         assert tracking_numbers[0]["courier"] == "auto"
 
     @pytest.mark.asyncio
-    async def test_edit_tracking_updates_courier_selection(self):
+    async def test_edit_tracking_updates_courier_selection(self, entry_with_tracking):
         """Test that courier selection is properly updated when editing tracking."""
         from custom_components.greek_courier_tracker.config_flow import (
             GreekCourierTrackerOptionsFlow,
         )
 
-        # Create a mock config entry
-        mock_entry = MagicMock()
-        mock_entry.entry_id = "test_entry"
-        mock_entry.options = {
-            "tracking_numbers": [
-                {
-                    "tracking_number": "1234567890",
-                    "name": "My Package",
-                    "stop_tracking_delivered": False,
-                    "courier": "auto",
-                }
-            ],
-            "scan_interval": 30,
-        }
-        mock_entry.data = {}
-
         # Create options flow
-        flow = GreekCourierTrackerOptionsFlow(mock_entry)
+        flow = GreekCourierTrackerOptionsFlow(entry_with_tracking)
 
         # Submit the edit form with a different courier
         result = await flow.async_step_edit_tracking(
@@ -124,7 +135,7 @@ class TestCourierDropdown:
         assert tracking_numbers[0]["stop_tracking_delivered"] is True
 
     @pytest.mark.asyncio
-    async def test_add_tracking_all_couriers_valid(self):
+    async def test_add_tracking_all_couriers_valid(self, empty_entry):
         """Test that all valid courier codes can be saved."""
         from custom_components.greek_courier_tracker.config_flow import (
             GreekCourierTrackerOptionsFlow,
@@ -134,15 +145,7 @@ class TestCourierDropdown:
         valid_couriers = [code for code, _ in COURIER_LIST]
 
         for courier_code in valid_couriers:
-            mock_entry = MagicMock()
-            mock_entry.entry_id = "test_entry"
-            mock_entry.options = {
-                "tracking_numbers": [],
-                "scan_interval": 30,
-            }
-            mock_entry.data = {}
-
-            flow = GreekCourierTrackerOptionsFlow(mock_entry)
+            flow = GreekCourierTrackerOptionsFlow(empty_entry)
 
             result = await flow.async_step_add_tracking(
                 user_input={
@@ -183,7 +186,7 @@ class TestCourierDropdown:
     @pytest.mark.asyncio
     async def test_migration_adds_courier_field(self):
         """Test that migration adds courier field to existing data."""
-        from custom_components.greek_courier_tracker.config_flow import _migrate_tracking_data
+        from custom_components.greek_courier_tracker import _migrate_tracking_data
 
         # Test old format (list of strings)
         old_data = ["SE123456789GR", "BN12345678"]
@@ -257,28 +260,13 @@ class TestCourierDropdown:
         assert result[0]["name"] == "ELTA Package"
 
     @pytest.mark.asyncio
-    async def test_add_tracking_duplicate_number_error(self):
+    async def test_add_tracking_duplicate_number_error(self, entry_with_tracking):
         """Test that duplicate tracking numbers are rejected."""
         from custom_components.greek_courier_tracker.config_flow import (
             GreekCourierTrackerOptionsFlow,
         )
 
-        mock_entry = MagicMock()
-        mock_entry.entry_id = "test_entry"
-        mock_entry.options = {
-            "tracking_numbers": [
-                {
-                    "tracking_number": "1234567890",
-                    "name": "Existing Package",
-                    "stop_tracking_delivered": False,
-                    "courier": "auto",
-                }
-            ],
-            "scan_interval": 30,
-        }
-        mock_entry.data = {}
-
-        flow = GreekCourierTrackerOptionsFlow(mock_entry)
+        flow = GreekCourierTrackerOptionsFlow(entry_with_tracking)
 
         # Try to add duplicate
         result = await flow.async_step_add_tracking(
@@ -295,21 +283,13 @@ class TestCourierDropdown:
         assert "tracking_number" in result["errors"]
 
     @pytest.mark.asyncio
-    async def test_add_tracking_empty_number_error(self):
+    async def test_add_tracking_empty_number_error(self, empty_entry):
         """Test that empty tracking numbers are rejected."""
         from custom_components.greek_courier_tracker.config_flow import (
             GreekCourierTrackerOptionsFlow,
         )
 
-        mock_entry = MagicMock()
-        mock_entry.entry_id = "test_entry"
-        mock_entry.options = {
-            "tracking_numbers": [],
-            "scan_interval": 30,
-        }
-        mock_entry.data = {}
-
-        flow = GreekCourierTrackerOptionsFlow(mock_entry)
+        flow = GreekCourierTrackerOptionsFlow(empty_entry)
 
         result = await flow.async_step_add_tracking(
             user_input={
@@ -405,7 +385,7 @@ class TestCourierSelectionWithAllCodes:
         ("courier_center", "Courier Center"),
         ("box_now", "Box Now"),
     ])
-    async def test_each_courier_code_can_be_saved(self, courier_code, expected_name):
+    async def test_each_courier_code_can_be_saved(self, courier_code, expected_name, empty_entry):
         """Test that each courier code can be saved properly."""
         from custom_components.greek_courier_tracker.config_flow import (
             GreekCourierTrackerOptionsFlow,
@@ -417,15 +397,7 @@ class TestCourierSelectionWithAllCodes:
         assert COURIER_NAMES[courier_code] == expected_name
 
         # Verify it can be saved in a tracking entry
-        mock_entry = MagicMock()
-        mock_entry.entry_id = "test_entry"
-        mock_entry.options = {
-            "tracking_numbers": [],
-            "scan_interval": 30,
-        }
-        mock_entry.data = {}
-
-        flow = GreekCourierTrackerOptionsFlow(mock_entry)
+        flow = GreekCourierTrackerOptionsFlow(empty_entry)
 
         result = await flow.async_step_add_tracking(
             user_input={
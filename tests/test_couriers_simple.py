@@ -69,6 +69,13 @@ class TestStatusTranslation:
         result = courier.translate_status("Η αποστολή παραδόθηκε", courier.STATUS_TRANSLATIONS)
         assert result == "Delivered"
 
+    def test_speedex_status_translation_case(self):
+        """Test that uppercase page statuses translate exactly and other cases still match."""
+        courier = SpeedExCourier()
+        assert courier.translate_status("ΣΕ ΜΕΤΑΦΟΡΑ", courier.STATUS_TRANSLATIONS) == "In Transit"
+        assert courier.translate_status("σε μεταφορα", courier.STATUS_TRANSLATIONS) == "In Transit"
+        assert courier.translate_status("ΑΓΝΩΣΤΟ", courier.STATUS_TRANSLATIONS) == "ΑΓΝΩΣΤΟ"
+
     def test_status_category_delivered(self):
         """Test delivered status category."""
         courier = ELTACourier()
@@ -103,6 +110,79 @@ class TestStatusTranslation:
         assert category == "unknown"
 
 
+class TestHtmlParsing:
+    """Tests for the regex extraction of scraped tracking pages."""
+
+    def test_courier_center_regex_matches_soup(self):
+        """Test that regex and BeautifulSoup parsing agree for Courier Center."""
+        from bs4 import BeautifulSoup
+
+        courier = CourierCenterCourier()
+        html = (
+            '<div class="tr head"><div>Date</div></div>'
+            '<div class="tr"><div id="date">15-02-2026</div><div id="time">14:30</div>'
+            '<div id="area">Athens &amp; Piraeus</div><div id="action">DeliveryCompleted</div></div>'
+            '<div class="status">DeliveryCompleted</div>'
+        )
+
+        result = courier._parse_html("CC12345678", html)
+
+        assert result == courier._parse_soup("CC12345678", BeautifulSoup(html, "html.parser"))
+        assert result.status_category == "delivered"
+        assert result.latest_event.location == "Athens & Piraeus"
+
+    def test_geniki_markup_in_field_uses_soup(self):
+        """Test that fields containing markup fall back to BeautifulSoup."""
+        courier = GenikiCourier()
+        html = (
+            '<div class="tracking-checkpoint">'
+            '<div class="checkpoint-status"><b>ΠΑΡΑΔΟΣΗ</b></div>'
+            '<div class="checkpoint-date">Δευτέρα, 15/02/2026</div>'
+            '</div>'
+        )
+
+        result = courier._parse_html("GT123456789", html)
+
+        assert result.status == "Delivered"
+        assert result.latest_event.date == "15/02/2026"
+
+    def test_speedex_cards_with_extra_classes(self):
+        """Test that SpeedEx cards and alerts with several classes are parsed."""
+        courier = SpeedExCourier()
+        html = (
+            '<nav><div class="menu">Home</div></nav>'
+            '<div class="timeline-card mb-1"><h4 class="card-title">Η ΑΠΟΣΤΟΛΗ ΠΑΡΑΔΟΘΗΚΕ</h4>'
+            '<span class="font-small-3">Αθήνα, 15/02/2026 στις 14:30</span></div>'
+        )
+
+        result = courier._parse_html("SP12345678", html)
+
+        assert result.status_category == "delivered"
+        assert result.latest_event.location == "Αθήνα"
+        assert result.latest_event.time == "14:30"
+
+        not_found = courier._parse_html("SP12345678", '<div class="alert alert-warning">-</div>')
+        assert not_found.status == "Not Found"
+
+    def test_speedex_regex_matches_soup(self):
+        """Test that regex and BeautifulSoup parsing agree for SpeedEx."""
+        from bs4 import BeautifulSoup
+
+        courier = SpeedExCourier()
+        html = (
+            '<div class="timeline-card"><h4 class="card-title">ΣΕ ΜΕΤΑΦΟΡΑ</h4>'
+            '<span class="font-small-3">Θεσσαλονίκη, 14/02/2026 στις 10:15</span></div>'
+            '<div class="timeline-card"><h4 class="card-title">ΠΑΡΑΛΑΒΗ</h4>'
+            '<span class="font-small-3">Αθήνα, 13/02/2026</span></div>'
+        )
+
+        result = courier._parse_html("SP12345678", html)
+
+        assert result == courier._parse_soup("SP12345678", BeautifulSoup(html, "html.parser"))
+        assert result.status_category == "in_transit"
+        assert result.events[1].date == "13/02/2026"
+
+
 class TestCourierFactory:
     """Tests for the courier factory functions."""
 
@@ -158,6 +238,9 @@ class TestTrackingResult:
         assert result.status_category == "delivered"
         assert len(result.events) == 1
         assert result.latest_event is not None
+        # Slotted: no per-instance __dict__ for the events kept in memory
+        assert not hasattr(event, "__dict__")
+        assert not hasattr(result, "__dict__")
 
     def test_tracking_result_error(self):
         """Test creating an error TrackingResult."""
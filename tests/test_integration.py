@@ -76,6 +76,54 @@ class TestConfigFlow:
         result = _parse_tracking_numbers("SE123456789GR, , , BN12345678")
         assert len(result) == 2
 
+    @pytest.mark.asyncio
+    async def test_migrate_entry_from_string_list(self):
+        """Test that old entries are migrated to the current format once."""
+        from custom_components.greek_courier_tracker import async_migrate_entry
+
+        hass = MagicMock()
+        entry = MagicMock(spec=ConfigEntry)
+        entry.version = 1
+        entry.data = {"tracking_numbers": ["SE123456789GR"], "scan_interval": 2}
+        entry.options = {}
+
+        assert await async_migrate_entry(hass, entry) is True
+
+        kwargs = hass.config_entries.async_update_entry.call_args.kwargs
+        assert kwargs["version"] == 4
+        assert kwargs["data"]["tracking_numbers"] == [{
+            "tracking_number": "SE123456789GR",
+            "name": "SE123456789GR",
+            "stop_tracking_delivered": False,
+            "courier": "auto",
+        }]
+        assert kwargs["data"]["scan_interval"] == 120
+
+    @pytest.mark.asyncio
+    async def test_migrate_entry_scan_interval_to_minutes(self):
+        """Test that scan intervals stored in hours are converted to minutes."""
+        from custom_components.greek_courier_tracker import async_migrate_entry
+
+        hass = MagicMock()
+        entry = MagicMock(spec=ConfigEntry)
+        entry.version = 3
+        tracking = {
+            "tracking_number": "SE123456789GR",
+            "name": "My Package",
+            "stop_tracking_delivered": False,
+            "courier": "elta",
+        }
+        entry.data = {"tracking_numbers": [tracking], "scan_interval": 1}
+        entry.options = {"tracking_numbers": [tracking], "scan_interval": 6}
+
+        assert await async_migrate_entry(hass, entry) is True
+
+        kwargs = hass.config_entries.async_update_entry.call_args.kwargs
+        assert kwargs["version"] == 4
+        assert kwargs["data"]["scan_interval"] == 60
+        assert kwargs["options"]["scan_interval"] == 360
+        assert kwargs["options"]["tracking_numbers"] == [tracking]
+
 
 class TestCoordinator:
     """Tests for the data update coordinator."""
@@ -111,11 +159,11 @@ class TestCoordinator:
             hass=mock_hass,
             tracking_numbers=["SE123456789GR", "BN12345678"],
             tracking_configs=tracking_configs,
-            scan_interval=1,
+            scan_interval=30,
         )
 
-        assert coordinator.tracking_numbers == ["SE123456789GR", "BN12345678"]
-        assert coordinator.update_interval == timedelta(hours=1)
+        assert coordinator.tracking_numbers == ("SE123456789GR", "BN12345678")
+        assert coordinator.update_interval == timedelta(minutes=30)
 
     @pytest.mark.asyncio
     async def test_coordinator_empty_tracking_numbers(self):
@@ -142,6 +190,148 @@ class TestCoordinator:
         result = await coordinator._async_update_data()
         assert result == {}
 
+    @pytest.mark.asyncio
+    async def test_coordinator_backs_off_delivered(self):
+        """Test that delivered parcels are polled less often than in-transit ones."""
+        from custom_components.greek_courier_tracker import (
+            GreekCourierDataUpdateCoordinator,
+        )
+        from custom_components.greek_courier_tracker.couriers.base import TrackingResult
+
+        mock_hass = MagicMock()
+        mock_hass.data = {}
+        mock_hass.config = MagicMock()
+        mock_hass.config.asynchronous_panel = False
+
+        coordinator = GreekCourierDataUpdateCoordinator(
+            hass=mock_hass,
+            tracking_numbers=["SE123456789GR", "BN12345678"],
+            tracking_configs={},
+            scan_interval=1,
+        )
+        interval = coordinator.update_interval.total_seconds()
+
+        def _result(number: str, category: str) -> TrackingResult:
+            return TrackingResult(
+                success=True,
+                tracking_number=number,
+                courier="elta",
+                courier_name="ELTA Courier",
+                status="Status",
+                status_category=category,
+                events=[],
+            )
+
+        coordinator._schedule_next_poll("SE123456789GR", _result("SE123456789GR", "delivered"), 0.0)
+        coordinator._schedule_next_poll("BN12345678", _result("BN12345678", "in_transit"), 0.0)
+
+        # In-transit parcels are due on the next tick, delivered ones much later
+        assert coordinator._next_poll["BN12345678"] < interval
+        assert coordinator._next_poll["SE123456789GR"] > 10 * interval
+
+    @pytest.mark.asyncio
+    async def test_empty_answer_does_not_pin_courier(self):
+        """Test that a courier answering with an empty page is not remembered."""
+        from custom_components.greek_courier_tracker import (
+            GreekCourierDataUpdateCoordinator,
+        )
+        from custom_components.greek_courier_tracker.couriers.base import (
+            TrackingEvent,
+            TrackingResult,
+        )
+
+        mock_hass = MagicMock()
+        mock_hass.data = {}
+        mock_hass.config = MagicMock()
+        mock_hass.config.asynchronous_panel = False
+
+        coordinator = GreekCourierDataUpdateCoordinator(
+            hass=mock_hass,
+            tracking_numbers=["1234567890"],
+            tracking_configs={},
+            scan_interval=30,
+        )
+        coordinator._session = MagicMock()
+
+        empty = TrackingResult(
+            success=True,
+            tracking_number="1234567890",
+            courier="geniki",
+            courier_name="Geniki Taxydromiki",
+            status="Unknown",
+            status_category="unknown",
+            events=[],
+        )
+        event = TrackingEvent(date="15-02-2026", time="10:30", location="Athens", status="In Transit")
+        found = TrackingResult(
+            success=True,
+            tracking_number="1234567890",
+            courier="acs",
+            courier_name="ACS Courier",
+            status="In Transit",
+            status_category="in_transit",
+            events=[event],
+            latest_event=event,
+        )
+
+        with patch(
+            "custom_components.greek_courier_tracker.track_with_auto_detect",
+            AsyncMock(side_effect=[empty, found]),
+        ) as auto_detect, patch(
+            "custom_components.greek_courier_tracker.track_with_known_courier",
+            AsyncMock(return_value=empty),
+        ) as known_courier:
+            await coordinator._async_update_data()
+            assert "1234567890" not in coordinator._courier_cache
+
+            # Due again on the next refresh, which finds the real courier
+            coordinator._next_poll.clear()
+            data = await coordinator._async_update_data()
+
+        assert auto_detect.await_count == 2
+        known_courier.assert_not_awaited()
+        assert data["1234567890"].courier == "acs"
+        assert coordinator._courier_cache["1234567890"] == "acs"
+
+    def test_saved_result_round_trip(self):
+        """Test that results saved to the store are restored unchanged."""
+        from custom_components.greek_courier_tracker import (
+            _result_from_dict,
+            _result_to_dict,
+        )
+        from custom_components.greek_courier_tracker.couriers.base import (
+            TrackingEvent,
+            TrackingResult,
+        )
+
+        event = TrackingEvent(
+            date="2024-01-15",
+            time="10:30",
+            location="Athens",
+            status="Delivered",
+            status_translated="Delivered",
+        )
+        result = TrackingResult(
+            success=True,
+            tracking_number="SE123456789GR",
+            courier="elta",
+            courier_name="ELTA Courier",
+            status="Delivered",
+            status_category="delivered",
+            events=[event],
+            latest_event=event,
+            raw_data={"large": "response"},
+            last_updated="2024-01-15T10:30:00+00:00",
+        )
+
+        restored = _result_from_dict(_result_to_dict(result))
+
+        # The raw API response is not saved
+        assert restored.raw_data is None
+        assert restored.events == [event]
+        assert restored.latest_event == event
+        assert restored.last_updated == result.last_updated
+
 
 class TestSensorEntity:
     """Tests for the sensor entity."""
@@ -263,6 +453,12 @@ class TestSensorEntity:
         assert attrs["stop_tracking_delivered"] is False
         assert attrs["tracking_stopped"] is False
         assert len(attrs["events"]) == 1
+        assert attrs["events_total"] == 1
+
+        # Reused until the result is replaced or its timestamp refreshed
+        assert sensor.extra_state_attributes is attrs
+        mock_coordinator.data["SE123456789GR"].last_updated = "2026-02-15T15:00:00+00:00"
+        assert sensor.extra_state_attributes["last_updated"] == "2026-02-15T15:00:00+00:00"
 
     @pytest.mark.asyncio
     async def test_sensor_no_data(self):
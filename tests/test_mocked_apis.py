@@ -5,18 +5,24 @@ without making actual API calls. This ensures tests are fast, reliable,
 and don't require valid tracking numbers or network access.
 """
 
+import asyncio
+from contextlib import ExitStack
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 import aiohttp
 
 from custom_components.greek_courier_tracker.couriers import (
+    COURIER_REGISTRY,
     ELTACourier,
     ACSCourier,
     SpeedExCourier,
     BoxNowCourier,
     GenikiCourier,
     CourierCenterCourier,
+    track_with_auto_detect,
 )
+from custom_components.greek_courier_tracker.couriers.base import TrackingEvent, TrackingResult
 
 
 @pytest.mark.asyncio
@@ -360,6 +366,8 @@ class TestStatusTranslations:
 
             assert result.latest_event is not None
             assert result.latest_event.status_translated == "Delivered"
+            # The raw API response is only kept with DEBUG_RAW enabled
+            assert result.raw_data is None
 
     async def test_acs_status_translation(self):
         """Test ACS Greek to English status translation."""
@@ -390,3 +398,88 @@ class TestStatusTranslations:
 
             assert result.latest_event is not None
             assert result.latest_event.status_translated == "In Transit"
+
+
+@pytest.mark.asyncio
+class TestRetryMocked:
+    """Mocked tests for the retry logic."""
+
+    async def test_client_error_not_retried(self):
+        """Test that HTTP 4xx errors are returned without retrying."""
+        from custom_components.greek_courier_tracker.couriers import _track_with_retry
+
+        courier = ELTACourier()
+
+        with patch("aiohttp.ClientSession.post") as mock_post:
+            mock_post.return_value.__aenter__.return_value.status = 404
+
+            result = await _track_with_retry(courier, "SE123456789GR")
+
+            assert result.success is False
+            assert result.retryable is False
+            assert mock_post.call_count == 1
+
+
+def _result(courier, status, events=()):
+    """Build a successful result of the given courier."""
+    return TrackingResult(
+        success=True,
+        tracking_number="1234567890",
+        courier=courier.COURIER_CODE,
+        courier_name=courier.COURIER_NAME,
+        status=status,
+        status_category="unknown",
+        events=list(events),
+    )
+
+
+@pytest.mark.asyncio
+class TestAutoDetectMocked:
+    """Mocked tests for querying all couriers during auto-detect."""
+
+    def _patch_couriers(self, answers):
+        """Patch every courier to answer with a status after a delay (default: Not Found)."""
+        patches = []
+        for courier_cls in COURIER_REGISTRY.values():
+            delay, status, events = answers.get(courier_cls, (0, "Not Found", ()))
+
+            async def track(self, tracking_number, delay=delay, status=status, events=events):
+                await asyncio.sleep(delay)
+                return _result(self, status, events)
+
+            patches.append(patch.object(courier_cls, "track", track))
+        return patches
+
+    async def test_empty_answer_does_not_beat_events(self):
+        """Test that a fast answer without events loses to a slower one with events."""
+        event = TrackingEvent(date="15-02-2026", time=None, location="Athens", status="In Transit")
+        answers = {
+            GenikiCourier: (0, "Unknown", ()),
+            ACSCourier: (0.05, "In Transit", (event,)),
+        }
+
+        with ExitStack() as stack, patch(
+            "custom_components.greek_courier_tracker.couriers.RETRY_BACKOFF", 0
+        ):
+            for courier_patch in self._patch_couriers(answers):
+                stack.enter_context(courier_patch)
+            result = await track_with_auto_detect("1234567890", MagicMock())
+
+        assert result.courier == "acs"
+        assert result.status == "In Transit"
+
+    async def test_empty_answers_picked_in_registry_order(self):
+        """Test that without events the first empty answer in registry order wins."""
+        answers = {
+            GenikiCourier: (0.05, "Unknown", ()),
+            CourierCenterCourier: (0, "Unknown", ()),
+        }
+
+        with ExitStack() as stack, patch(
+            "custom_components.greek_courier_tracker.couriers.RETRY_BACKOFF", 0
+        ):
+            for courier_patch in self._patch_couriers(answers):
+                stack.enter_context(courier_patch)
+            result = await track_with_auto_detect("1234567890", MagicMock())
+
+        assert result.courier == "geniki"
@@ -1,6 +1,8 @@
 """Tests for courier factory functions."""
 
 import pytest
+from unittest.mock import MagicMock
+
 from custom_components.greek_courier_tracker.couriers import (
     ELTACourier,
     ACSCourier,
@@ -8,6 +10,7 @@ from custom_components.greek_courier_tracker.couriers import (
     BoxNowCourier,
     GenikiCourier,
     CourierCenterCourier,
+    detect_courier,
     get_courier,
 )
 
@@ -34,3 +37,60 @@ class TestCourierFactory:
         assert get_courier("invalid") is None
         assert get_courier("") is None
         assert get_courier(None) is None
+
+    def test_get_courier_with_session(self):
+        """Test that a shared session is handed to the courier."""
+        session = MagicMock()
+        courier = get_courier("elta", session)
+        assert courier is not None
+        assert courier._session is session
+
+    def test_get_courier_reuses_instances(self):
+        """Test that couriers are created once per session."""
+        session = MagicMock()
+        assert get_courier("acs", session) is get_courier("acs", session)
+        assert get_courier("acs", session) is not get_courier("acs")
+
+    def test_detect_courier(self):
+        """Test detecting the courier from the tracking number format."""
+        assert detect_courier("SE123456789GR") == "elta"
+        assert detect_courier("se123456789gr") == "elta"
+        assert detect_courier("SP12345678") == "speedex"
+        assert detect_courier("BN123456789") == "box_now"
+        assert detect_courier("GT123456789") == "geniki"
+        # Digit-only numbers are used by several couriers
+        assert detect_courier("1234567890") is None
+        assert detect_courier("not-a-number") is None
+
+    def test_matches_tracking_number(self):
+        """Test matching tracking numbers against each courier's formats."""
+        assert ELTACourier.matches_tracking_number("SE123456789GR")
+        assert ELTACourier.matches_tracking_number(" se123456789gr ")
+        assert ELTACourier.matches_tracking_number("GR123456789AB")
+        assert not ELTACourier.matches_tracking_number("SE123456789GX")
+        assert ACSCourier.matches_tracking_number("1234567890")
+        assert not ACSCourier.matches_tracking_number("SE123456789GR")
+        assert SpeedExCourier.matches_tracking_number("123456789AB")
+        assert SpeedExCourier.matches_tracking_number("SP12345678")
+        assert BoxNowCourier.matches_tracking_number("BN123456789")
+        assert GenikiCourier.matches_tracking_number("GT123456789")
+
+    def test_number_lengths_from_patterns(self):
+        """Test that the length prechecks are worked out from the patterns."""
+        assert ELTACourier.NUMBER_LENGTHS == range(13, 14)
+        assert BoxNowCourier.NUMBER_LENGTHS == range(10, 13)
+        assert GenikiCourier.NUMBER_LENGTHS == range(10, 14)
+
+    def test_detected_courier_matches_number(self):
+        """Test that a detected courier accepts the number by its own formats."""
+        for number in ("SE123456789GR", "SP12345678", "BN123456789", "CC12345678", "GT123456789"):
+            assert get_courier(detect_courier(number)).matches_tracking_number(number)
+
+    def test_near_miss_tracking_numbers_rejected(self):
+        """Test that numbers just outside a format are rejected."""
+        assert not GenikiCourier.matches_tracking_number("1234567890123")
+        assert not CourierCenterCourier.matches_tracking_number("123456789")
+        assert not ACSCourier.matches_tracking_number("1234567890\n1")
+        assert detect_courier("GT123456789012") is None
+        assert detect_courier("SE123456789G") is None
+        assert detect_courier("BN1234567") is None